@@ -0,0 +1,324 @@
+"""
+Compact Per-Run Parquet Files into Per-Season Files
+
+Daily nhl_to_parquet.py runs (and live-poller batches) leave one small file
+per stream per run. This merges them, together with any existing compacted
+file, into one file per stream and season:
+
+    <output-prefix>_s2425/games.parquet
+    <output-prefix>_s2425/play_by_play.parquet
+
+the same layout as the data_backfill_* directories, so a season directory
+loads as-is with parquet_to_snowflake.py. Each output file is:
+
+    - de-duplicated on the stream's key (validate_parquet.STREAM_CHECKS),
+      keeping the most recently loaded row
+    - sorted by game id / date, so row-group statistics give tight ranges and
+      readers can skip row groups by game range
+    - zstd-compressed, dictionary-encoded only on low-cardinality columns,
+      with statistics and row groups sized by --row-group-mb
+
+Only incremental streams are compacted; full-replace snapshots (rosters,
+current standings, ...) are superseded by each run rather than accumulated.
+
+Usage:
+    python compact_parquet.py --input './data_runs/*' --output-prefix ./data_compacted
+    python compact_parquet.py --input ./data_live/* --output-prefix ./data_live_compacted --streams play_by_play
+"""
+
+import argparse
+import glob
+import os
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from nhl_extractor import RAW_STREAM_SUFFIX
+from validate_parquet import checks_for, resolve_column
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Incremental streams and their sort order (column specs as in validate_parquet)
+SORT_KEYS = {
+    'games': ('id',),
+    'daily_standings': ('date', 'teamAbbrev|teamAbbrev_default'),
+    'game_boxscore': ('id|game_id',),
+    'game_summaries': ('id|game_id',),
+    'play_by_play': ('game_id', 'sortOrder'),
+}
+RAW_SORT_KEYS = ('game_id',)
+
+SEASON_COLUMNS = 'season|seasonId'
+GAME_ID_COLUMNS = 'game_id|id'
+LOADED_AT_COLUMNS = '_loaded_at|_etl_loaded_at'
+
+# String columns with at most this share of distinct values get dictionary encoding
+DICTIONARY_MAX_DISTINCT_RATIO = 0.5
+
+
+def sort_keys_for(stream_name: str) -> Optional[Tuple[str, ...]]:
+    """Sort keys for a compactable stream (None if the stream isn't compacted)."""
+    if stream_name.endswith(RAW_STREAM_SUFFIX):
+        return RAW_SORT_KEYS
+    return SORT_KEYS.get(stream_name)
+
+
+def season_label(season: int) -> str:
+    """20242025 -> 's2425', matching the data_backfill_* directory names."""
+    return f"s{str(season)[2:4]}{str(season)[6:8]}"
+
+
+def collect_files(inputs: List[str]) -> Dict[str, List[Path]]:
+    """
+    Expand input directories/globs into parquet files grouped by stream.
+
+    Directories contribute their top-level *.parquet files (so rejected/ is
+    never picked up); files are taken as given.
+    """
+    files = defaultdict(list)
+    for pattern in inputs:
+        for match in sorted(glob.glob(pattern)) or [pattern]:
+            path = Path(match)
+            candidates = sorted(path.glob("*.parquet")) if path.is_dir() else [path]
+            for candidate in candidates:
+                if candidate.suffix == '.parquet' and candidate.exists():
+                    files[candidate.stem].append(candidate.resolve())
+    return files
+
+
+def table_columns(table: pa.Table) -> Dict[str, str]:
+    return {name.lower(): name for name in table.column_names}
+
+
+def season_of_rows(table: pa.Table) -> pa.ChunkedArray:
+    """
+    Season for every row: the season column where present, otherwise derived
+    from the game id (2024020001 -> 20242025), which covers live-poller
+    batches that only carry GAME_ID.
+    """
+    columns = table_columns(table)
+    season_column = resolve_column(SEASON_COLUMNS, columns)
+    game_id_column = resolve_column(GAME_ID_COLUMNS, columns)
+
+    season = None
+    if season_column:
+        season = pc.cast(table[season_column], pa.int64())
+    if game_id_column:
+        start_year = pc.divide(pc.cast(table[game_id_column], pa.int64()), 1000000)
+        from_game_id = pc.add(pc.multiply(start_year, 10000), pc.add(start_year, 1))
+        season = from_game_id if season is None else pc.coalesce(season, from_game_id)
+    if season is None:
+        raise ValueError("no season or game id column to partition by")
+    return season
+
+
+def deduplicate(table: pa.Table, key_specs: Tuple[str, ...]) -> pa.Table:
+    """Keep one row per key: the one with the latest _loaded_at/_etl_loaded_at."""
+    columns = table_columns(table)
+    keys = [resolve_column(spec, columns) for spec in key_specs]
+    if not keys or None in keys:
+        return table
+
+    table = table.append_column('__row', pa.array(range(table.num_rows), type=pa.int64()))
+    loaded_at = resolve_column(LOADED_AT_COLUMNS, columns)
+    ordered = table.sort_by([(loaded_at, 'descending')]) if loaded_at else table
+    latest = ordered.group_by(keys, use_threads=False).aggregate([('__row', 'first')])
+    rows = pc.sort_indices(latest['__row_first'])
+    return table.take(pc.take(latest['__row_first'], rows)).drop_columns(['__row'])
+
+
+def dictionary_columns(table: pa.Table) -> List[str]:
+    """String columns repetitive enough to benefit from dictionary encoding."""
+    selected = []
+    for name in table.column_names:
+        column = table[name]
+        if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+            # Numeric/boolean columns are small already; leave them plain
+            continue
+        if table.num_rows and pc.count_distinct(column).as_py() <= DICTIONARY_MAX_DISTINCT_RATIO * table.num_rows:
+            selected.append(name)
+    return selected
+
+
+def write_compacted(table: pa.Table, output_file: str, row_group_mb: float):
+    """Write a compacted file with tuned encoding (atomically, via a temp file)."""
+    row_bytes = table.nbytes / max(table.num_rows, 1)
+    row_group_size = max(1024, int(row_group_mb * 1024 * 1024 / max(row_bytes, 1)))
+
+    tmp_file = f"{output_file}.tmp"
+    pq.write_table(
+        table,
+        tmp_file,
+        compression='zstd',
+        compression_level=6,
+        use_dictionary=dictionary_columns(table),
+        write_statistics=True,
+        row_group_size=row_group_size,
+    )
+    os.replace(tmp_file, output_file)
+
+
+def compact_stream(stream_name: str, files: List[Path], output_prefix: str,
+                   row_group_mb: float) -> List[str]:
+    """
+    Merge one stream's files into per-season compacted files.
+
+    Returns:
+        list of files written
+    """
+    sort_specs = sort_keys_for(stream_name)
+    checks = checks_for(stream_name)
+
+    tables = [pq.read_table(path) for path in files]
+    merged = pa.concat_tables(tables, promote_options='permissive')
+    if len(table_columns(merged)) < merged.num_columns:
+        raise ValueError(
+            f"{stream_name} inputs mix the nested and flattened (upper-case) layouts; "
+            f"compact them into separate output prefixes"
+        )
+    seasons = season_of_rows(merged)
+
+    written = []
+    for season in pc.unique(seasons).to_pylist():
+        if season is None:
+            logger.warning(f"  {stream_name}: skipping rows without a season")
+            continue
+
+        output_dir = f"{output_prefix}_{season_label(season)}"
+        output_file = os.path.join(output_dir, f"{stream_name}.parquet")
+        season_table = merged.filter(pc.equal(seasons, season))
+
+        # Fold in the existing compacted file unless it was one of the inputs
+        if os.path.exists(output_file) and Path(output_file).resolve() not in files:
+            existing = pq.read_table(output_file)
+            season_table = pa.concat_tables([existing, season_table], promote_options='permissive')
+
+        rows_in = season_table.num_rows
+        if checks is not None:
+            season_table = deduplicate(season_table, checks.keys)
+
+        columns = table_columns(season_table)
+        sort_columns = [resolve_column(spec, columns) for spec in sort_specs]
+        sort_columns = [column for column in sort_columns if column]
+        if sort_columns:
+            season_table = season_table.sort_by([(column, 'ascending') for column in sort_columns])
+
+        os.makedirs(output_dir, exist_ok=True)
+        write_compacted(season_table, output_file, row_group_mb)
+        written.append(output_file)
+
+        metadata = pq.ParquetFile(output_file).metadata
+        logger.info(
+            f"✓ {output_file}: {season_table.num_rows} rows "
+            f"({rows_in - season_table.num_rows} duplicates dropped), "
+            f"{metadata.num_row_groups} row group(s), {os.path.getsize(output_file) / 1024:.0f} KiB"
+        )
+
+    return written
+
+
+def compact(inputs: List[str], output_prefix: str, streams: Optional[List[str]] = None,
+            row_group_mb: float = 16, remove_inputs: bool = False):
+    """
+    Compact per-run parquet files into per-season files.
+
+    Args:
+        inputs: Input directories, files or glob patterns
+        output_prefix: Prefix of the per-season output directories
+            ('<output_prefix>_s2425/')
+        streams: Only compact these streams (default: all compactable streams)
+        row_group_mb: Target uncompressed row-group size in MiB
+        remove_inputs: Delete the input files after their stream is compacted
+    """
+    files = collect_files(inputs)
+
+    logger.info("=" * 70)
+    logger.info("Compacting Parquet Files")
+    logger.info("=" * 70)
+    logger.info(f"Inputs: {', '.join(inputs)}")
+    logger.info(f"Output: {output_prefix}_s<season>/")
+    logger.info("=" * 70)
+
+    for stream_name, stream_files in sorted(files.items()):
+        if streams and stream_name not in streams:
+            continue
+        if sort_keys_for(stream_name) is None:
+            logger.info(f"- {stream_name}: full-replace snapshot, not compacted")
+            continue
+
+        logger.info(f"\nCompacting {stream_name} ({len(stream_files)} file(s))...")
+        written = compact_stream(stream_name, stream_files, output_prefix, row_group_mb)
+
+        if remove_inputs:
+            outputs = {Path(path).resolve() for path in written}
+            for path in stream_files:
+                if path not in outputs:
+                    path.unlink()
+            logger.info(f"  Removed {len(set(stream_files) - outputs)} input file(s)")
+
+    logger.info("\n" + "=" * 70)
+    logger.info("Compaction complete!")
+    logger.info("=" * 70)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Compact per-run Parquet files into sorted, tuned per-season files'
+    )
+    parser.add_argument(
+        '--input',
+        nargs='+',
+        required=True,
+        help='Input directories, files or glob patterns (quote globs)'
+    )
+    parser.add_argument(
+        '--output-prefix',
+        type=str,
+        default='./data_compacted',
+        help='Prefix for per-season output directories (default: ./data_compacted -> ./data_compacted_s2425/)'
+    )
+    parser.add_argument(
+        '--streams',
+        nargs='+',
+        default=None,
+        help='Only compact these streams (default: all incremental streams)'
+    )
+    parser.add_argument(
+        '--row-group-mb',
+        type=float,
+        default=16,
+        help='Target uncompressed row-group size in MiB (default: 16)'
+    )
+    parser.add_argument(
+        '--remove-inputs',
+        action='store_true',
+        help='Delete input files once their stream has been compacted'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        compact(
+            inputs=args.input,
+            output_prefix=args.output_prefix,
+            streams=args.streams,
+            row_group_mb=args.row_group_mb,
+            remove_inputs=args.remove_inputs,
+        )
+    except Exception as e:
+        logger.error(f"Error during compaction: {e}", exc_info=True)
+        raise
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+{% macro changed_games_cte() %}
+    {#- Incremental runs: renders the `changed_games as (...),` CTE, the games
+        int__game_loads marked changed after the target's max(_changed_at).
+        Place it first after `with`; it is evaluated once per model and every
+        changed_games_filter() in the model reads it. Games that never reach
+        the target (non-league games) stop being reselected once any later
+        build writes rows. Full builds render nothing. Models using it need a
+        `-- depends_on: {{ ref('int__game_loads') }}` line, since refs inside
+        an is_incremental() branch are invisible at parse time. -#}
+    {%- if is_incremental() -%}
+    {%- set target_columns = adapter.get_columns_in_relation(this) | map(attribute='name') | map('lower') | list -%}
+    {%- if '_changed_at' not in target_columns -%}
+        {{ exceptions.raise_compiler_error(
+            this ~ " has no _changed_at column: it predates the current incremental logic. "
+            ~ "Run `dbt build --full-refresh --select " ~ this.identifier ~ "` once."
+        ) }}
+    {%- endif %}
+changed_games as (
+    select game_id
+    from {{ ref('int__game_loads') }}
+    where changed_at > (
+        select coalesce(max(_changed_at), '1900-01-01'::timestamp_ntz)
+        from {{ this }}
+    )
+),
+    {%- endif -%}
+{% endmacro %}
+
+
+{% macro changed_games_filter(game_id_column) %}
+    {#- Restricts a CTE to the games of changed_games_cte() on incremental
+        runs; renders `true` on full builds. -#}
+    {%- if is_incremental() -%}
+    {{ game_id_column }} in (select game_id from changed_games)
+    {%- else -%}
+    true
+    {%- endif -%}
+{% endmacro %}
@@ -0,0 +1,17 @@
+{% macro snapshot_date_filter(date_column, target_date_expr='date') %}
+    {#- Incremental runs: restricts a daily-snapshot model to dates on or
+        after its last materialized date, less `snapshot_lookback_days` so a
+        late or re-extracted standings snapshot still replaces the days it
+        touches. Full builds render `true`. -#}
+    {%- if is_incremental() -%}
+    {{ date_column }} >= (
+        select coalesce(
+            dateadd(day, -{{ var('snapshot_lookback_days') }}, max({{ target_date_expr }})),
+            '1900-01-01'::date
+        )
+        from {{ this }}
+    )
+    {%- else -%}
+    true
+    {%- endif -%}
+{% endmacro %}
@@ -5,10 +5,26 @@
 
 with
 
+-- From the first loaded season (or 2020, whichever is earlier) to a year out
+date_range as (
+    select
+        least(coalesce(min(start_date)::date, '2020-01-01'::date), '2020-01-01'::date) as first_date,
+        greatest(coalesce(max(end_date)::date, current_date()), current_date()) + 365 as last_date
+    from {{ ref('int__season_dates') }}
+),
+
+day_offsets as (
+    select
+        row_number() over (order by seq4()) - 1 as day_offset
+    from table(generator(rowcount => 36600))  -- up to 100 years of dates
+),
+
 date_spine as (
     select
-        dateadd(day, seq4(), '2020-01-01'::date) as date
-    from table(generator(rowcount => 3650))  -- 10 years of dates
+        dateadd(day, o.day_offset, r.first_date) as date
+    from date_range r
+    inner join day_offsets o
+        on o.day_offset <= datediff(day, r.first_date, r.last_date)
 ),
 
 dates_with_attributes as (
@@ -108,5 +124,4 @@ select
         else false
     end as is_prime_game_day
 from dates_with_season_info
-where date >= '2015-10-01' and date <= current_date() + 365
 order by date_key
\ No newline at end of file
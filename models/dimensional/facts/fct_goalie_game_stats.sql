@@ -1,12 +1,22 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='game_key',
+    cluster_by=['season_key', 'date_key']
+) }}
+
+-- depends_on: {{ ref('int__game_loads') }}
 
 -- models/dimensional/facts/fct_goalie_game_stats.sql
 -- Goalie game-level statistics fact table.
 -- Grain: one row per (game, goalie). player_key/team_key are NHL natural ids;
 -- the goals-by-period breakdown comes from play-by-play (not estimated).
+-- Incremental: rebuilds only games loaded since the last build.
 
 with
 
+{{ changed_games_cte() }}
+
 league_games as (
     select *
     from {{ ref('int__league_games') }}
@@ -29,11 +39,16 @@ goalie_stats as (
         count_if(extract(hour from gs.toi) * 3600
             + extract(minute from gs.toi) * 60
             + extract(second from gs.toi) > 0)
-            over (partition by gs.game_id, gs.team_abv) as goalies_used_by_team
+            over (partition by gs.game_id, gs.team_abv) as goalies_used_by_team,
+        gl.last_loaded_at,
+        gl.changed_at
     from {{ ref('int__goalies_per_game_stats') }} gs
     inner join league_games lg
         on gs.game_id = lg.game_id
+    inner join {{ ref('int__game_loads') }} gl
+        on gs.game_id = gl.game_id
     where gs.game_type in ('regular', 'playoff')
+        and {{ changed_games_filter('gs.game_id') }}
 ),
 
 -- Real goals-allowed-by-period from the plays fact
@@ -49,6 +64,7 @@ goals_by_period as (
     where event_type_name = 'goal'
         and period_category != 'Shootout'
         and goalie_player_key is not null
+        and {{ changed_games_filter('game_key') }}
     group by game_id, player_id
 ),
 
@@ -143,7 +159,9 @@ goalie_game_facts as (
         gs.player_id,
         gs.game_id,
         gs.team_abv,
-        gs.name as player_name
+        gs.name as player_name,
+        gs.last_loaded_at as _loaded_at,
+        gs.changed_at as _changed_at
 
     from goalie_stats gs
     left join {{ ref('dim_teams') }} dt
@@ -201,7 +219,9 @@ select
     (is_starting_goalie and save_percentage >= 0.917 and goals_against <= 2) as quality_start,
     (is_starting_goalie and save_percentage < 0.850) as really_bad_start,
     -- Saves above/below what a league-average goalie would stop
-    saves - (shots_faced * {{ var('league_avg_save_pct') }}) as saves_above_average
+    saves - (shots_faced * {{ var('league_avg_save_pct') }}) as saves_above_average,
+    _loaded_at,
+    _changed_at
 from goalie_game_facts
 order by
     game_key,
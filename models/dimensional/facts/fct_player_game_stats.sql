@@ -1,4 +1,11 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='game_key',
+    cluster_by=['season_key', 'date_key']
+) }}
+
+-- depends_on: {{ ref('int__game_loads') }}
 
 -- models/dimensional/facts/fct_player_game_stats.sql
 -- Player (skater) game-level statistics fact table.
@@ -6,9 +13,13 @@
 -- with play-by-play-derived detail (real primary/secondary assists, PP/SH
 -- assists, SH/OT/empty-net goals, game-winning goals) — none of these are
 -- estimated anymore. player_key/team_key are NHL natural ids.
+-- Incremental: rebuilds only games loaded since the last build; every input
+-- below is per-game, so each CTE is filtered to those games.
 
 with
 
+{{ changed_games_cte() }}
+
 skater_stats as (
     select
         s.*,
@@ -24,6 +35,7 @@ skater_stats as (
     inner join {{ ref('int__league_games') }} lg
         on s.game_id = lg.game_id
     where s.game_type in ('regular', 'playoff')
+        and {{ changed_games_filter('s.game_id') }}
 ),
 
 -- Real (non-shootout) goals with attribution, from the plays fact
@@ -41,6 +53,7 @@ goal_events as (
     from {{ ref('fct_plays') }}
     where event_type_name = 'goal'
         and period_category != 'Shootout'
+        and {{ changed_games_filter('game_key') }}
 ),
 
 scorer_detail as (
@@ -81,6 +94,7 @@ game_winners as (
     from {{ ref('int__team_per_game_stats') }}
     where goals > goals_against
         and coalesce(last_period_type, 'REG') != 'SO'
+        and {{ changed_games_filter('game_id') }}
 ),
 
 goal_sequence as (
@@ -118,10 +132,12 @@ player_faceoffs as (
         select game_key, primary_player_key as player_id, 1 as won, 0 as lost
         from {{ ref('fct_plays') }}
         where event_type_name = 'faceoff' and primary_player_key is not null
+            and {{ changed_games_filter('game_key') }}
         union all
         select game_key, secondary_player_key as player_id, 0 as won, 1 as lost
         from {{ ref('fct_plays') }}
         where event_type_name = 'faceoff' and secondary_player_key is not null
+            and {{ changed_games_filter('game_key') }}
     )
     group by game_key, player_id
 ),
@@ -188,7 +204,9 @@ player_game_facts as (
         ss.player_id,
         ss.game_id,
         ss.team_abv,
-        ss.name as player_name
+        ss.name as player_name,
+        ss._loaded_at,
+        ss._changed_at
 
     from skater_stats ss
     left join {{ ref('dim_players') }} dp
@@ -252,7 +270,9 @@ select
     (goals >= 3) as hat_trick,
     (points >= 4) as four_point_game,
     (goals >= 4) as four_goal_game,
-    goals + assists as point_contributions
+    goals + assists as point_contributions,
+    _loaded_at,
+    _changed_at
 from player_game_facts
 order by
     game_key,
@@ -1,12 +1,23 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='game_key',
+    cluster_by=['season_key', 'date_key']
+) }}
+
+-- depends_on: {{ ref('int__game_loads') }}
 
 -- models/dimensional/facts/fct_plays.sql
 -- Play-by-play event-level fact table for league games.
 -- Grain: one row per (game, event). player_key values are NHL player ids
 -- (same natural key as dim_players).
+-- Incremental: each build replaces every event of the games loaded since the
+-- last build (whole games, so events dropped on re-extraction disappear too).
 
 with
 
+{{ changed_games_cte() }}
+
 plays_base as (
     select
         p.*,
@@ -15,10 +26,15 @@ plays_base as (
         lg.away_team_id as away_id,
         lg.away_team_abv as away_abv,
         lg.home_team_id as home_id,
-        lg.home_team_abv as home_abv
+        lg.home_team_abv as home_abv,
+        gl.last_loaded_at as _loaded_at,
+        gl.changed_at as _changed_at
     from {{ ref('stg_nhl__play_by_play') }} p
     inner join {{ ref('int__league_games') }} lg
         on p.game_id = lg.game_id
+    inner join {{ ref('int__game_loads') }} gl
+        on p.game_id = gl.game_id
+    where {{ changed_games_filter('p.game_id') }}
 ),
 
 play_facts as (
@@ -165,6 +181,8 @@ play_facts as (
         -- Metadata
         pb.home_side,
         pb.game_id,
+        pb._loaded_at,
+        pb._changed_at,
         case
             when pb.play_team_id = pb.home_id then pb.home_abv
             when pb.play_team_id = pb.away_id then pb.away_abv
@@ -243,7 +261,9 @@ select
         when period_number = 4 then 'Overtime'
         when period_number = 5 then 'Shootout'
         else 'Unknown'
-    end as period_category
+    end as period_category,
+    _loaded_at,
+    _changed_at
 from play_facts
 order by
     game_key,
@@ -1,15 +1,22 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='date_key',
+    cluster_by=['season_key', 'date_key']
+) }}
 
 -- models/dimensional/facts/fct_standings_daily.sql
 -- Daily standings snapshot fact table with complete home/road/shootout
 -- records, true regulation/ROW wins, and the league's own last-10 splits.
--- Grain: one row per (date, team).
+-- Grain: one row per (date, team). Incremental: appends the days since the
+-- last materialized date_key (re-deriving the snapshot_lookback_days window).
 
 with
 
 standings_base as (
     select *
     from {{ ref('int__standings_by_day') }}
+    where {{ snapshot_date_filter('date', "to_date(date_key::string, 'YYYYMMDD')") }}
 ),
 
 standings_facts as (
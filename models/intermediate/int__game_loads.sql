@@ -0,0 +1,70 @@
+{{ config(
+    materialized='incremental',
+    incremental_strategy='merge',
+    unique_key='game_id'
+) }}
+
+-- models/intermediate/int__game_loads.sql
+-- Load watermark per game: the latest raw load stamp across every feed a
+-- game-grain model is built from, and changed_at, the dbt run that first saw
+-- that stamp. Incremental facts rebuild the games changed after their own
+-- max(_changed_at) (see macros/changed_games_filter.sql). changed_at is on
+-- dbt's clock, so a backfill loaded with older raw stamps still counts as a
+-- change when it lands.
+-- Rows written by the Python loaders carry only _etl_loaded_at, so the stamp
+-- falls back to it where _loaded_at is null. Both are compared in UTC:
+-- _loaded_at is ISO text with an offset, _etl_loaded_at is written as naive
+-- UTC (nhl_to_parquet.etl_timestamp, nhl_live_poller).
+-- Reads the raw sources directly on purpose: only the max stamp per game
+-- is needed, and going through the deduplicating staging views would cost a
+-- full window pass over every play-by-play event. Materialized, so that one
+-- pass runs once per build rather than once per model that filters on it.
+
+with
+
+all_loads as (
+    select
+        ID::int as game_id,
+        coalesce(
+            convert_timezone('UTC', _loaded_at::timestamp_tz)::timestamp_ntz,
+            _etl_loaded_at::timestamp_ntz
+        ) as loaded_at
+    from {{ source('nhl_staging_data', 'games') }}
+    union all
+    select
+        ID::int as game_id,
+        coalesce(
+            convert_timezone('UTC', _loaded_at::timestamp_tz)::timestamp_ntz,
+            _etl_loaded_at::timestamp_ntz
+        ) as loaded_at
+    from {{ source('nhl_staging_data', 'game_boxscore') }}
+    union all
+    select
+        GAME_ID::int as game_id,
+        coalesce(
+            convert_timezone('UTC', _loaded_at::timestamp_tz)::timestamp_ntz,
+            _etl_loaded_at::timestamp_ntz
+        ) as loaded_at
+    from {{ source('nhl_staging_data', 'play_by_play') }}
+),
+
+game_loads as (
+    select
+        game_id,
+        max(loaded_at) as last_loaded_at
+    from all_loads
+    group by game_id
+)
+
+select
+    gl.game_id,
+    gl.last_loaded_at,
+    '{{ run_started_at.strftime("%Y-%m-%d %H:%M:%S.%f") }}'::timestamp_ntz as changed_at
+from game_loads gl
+{% if is_incremental() %}
+-- Only new games and games whose stamp moved; the rest keep their changed_at
+left join {{ this }} prev
+    on gl.game_id = prev.game_id
+where prev.game_id is null
+    or gl.last_loaded_at is distinct from prev.last_loaded_at
+{% endif %}
@@ -1,13 +1,25 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='game_id',
+    cluster_by=['season', 'game_id']
+) }}
+
+-- depends_on: {{ ref('int__game_loads') }}
 
 -- models/intermediate/int__skaters_per_game_stats.sql
 -- Extracts individual skater stats per game from each game boxscore
+-- Incremental: only boxscores of games loaded since the last build are
+-- re-flattened; their rows are replaced whole.
 
 with
 
+{{ changed_games_cte() }}
+
 games as (
     select *
     from {{ ref("stg_nhl__game_boxscore") }}
+    where {{ changed_games_filter('ID::int') }}
 ),
 
 away_team_forwards as (
@@ -166,7 +178,12 @@ all_skaters_per_game_stats as (
     from full_home_teams_stats
 )
 
-select *
-from all_skaters_per_game_stats
+select
+    s.*,
+    gl.last_loaded_at as _loaded_at,
+    gl.changed_at as _changed_at
+from all_skaters_per_game_stats s
+inner join {{ ref('int__game_loads') }} gl
+    on s.game_id = gl.game_id
 -- league games only: excludes All-Star / 4 Nations / preseason contamination
-where game_id in (select game_id from {{ ref('int__league_games') }})
+where s.game_id in (select game_id from {{ ref('int__league_games') }})
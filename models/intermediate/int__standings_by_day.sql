@@ -1,9 +1,20 @@
-{{ config(materialized='table') }}
+{{ config(
+    materialized='incremental',
+    incremental_strategy='delete+insert',
+    unique_key='date',
+    cluster_by=['season', 'date']
+) }}
 
 -- models/intermediate/int__standings_by_day.sql
 -- Compiles standings for every day in each season with continuous records
 -- for each team: the raw feed only has rows for dates a snapshot was taken,
 -- so we scaffold every (season, date, team) and forward-fill.
+--
+-- Incremental: only dates from the last materialized date (less the
+-- snapshot_lookback_days var) are scaffolded. Each team's last materialized
+-- row before that window is fed into the forward-fill as carried state, so
+-- the window functions see a few days instead of the whole history. A
+-- snapshot backfilled further back than the lookback needs --full-refresh.
 
 {% set fill_zero = [
     'games_played', 'points', 'wins', 'losses', 'ot_losses',
@@ -24,10 +35,11 @@ source_standings as (
     from {{ ref('stg_nhl__daily_standings') }}
 ),
 
-date_cte as (
+-- Day offsets from a season's first snapshot; a season spans under a year
+day_offsets as (
     select
-        dateadd(day, seq4(), '2020-01-01'::date) as date
-    from table(generator(rowcount => 3650))  -- 10 years of dates
+        row_number() over (order by seq4()) - 1 as day_offset
+    from table(generator(rowcount => 366))
 ),
 
 parsed_standings as (
@@ -96,13 +108,21 @@ teams_per_season as (
     from parsed_standings
 ),
 
-date_spine as (
+season_days as (
     select
         sdr.season,
-        d.date
+        dateadd(day, o.day_offset, sdr.season_start::date) as date
     from season_date_range sdr
-    cross join date_cte d
-    where d.date between sdr.season_start and sdr.season_end
+    inner join day_offsets o
+        on o.day_offset <= datediff(day, sdr.season_start, sdr.season_end)
+),
+
+date_spine as (
+    select
+        season,
+        date
+    from season_days
+    where {{ snapshot_date_filter('date') }}
 ),
 
 team_date_scaffold as (
@@ -128,13 +148,37 @@ standings_with_gaps as (
         s.conference,
         p.record,
         {% for col in fill_zero + fill_null %}
-        p.{{ col }}{{ ',' if not loop.last }}
+        p.{{ col }},
         {% endfor %}
+        false as is_carried_state
     from team_date_scaffold s
     left join parsed_standings p
         on s.date = p.date
         and s.team_abv = p.team_abv
         and s.season = p.season
+    {% if is_incremental() %}
+
+    union all
+
+    -- Last already-filled row per team ahead of the window: seeds the
+    -- forward-fill below and is dropped from the output
+    select
+        date,
+        season,
+        team_abv,
+        team_name,
+        division,
+        conference,
+        record,
+        {% for col in fill_zero + fill_null %}
+        {{ col }},
+        {% endfor %}
+        true as is_carried_state
+    from {{ this }}
+    where not ({{ snapshot_date_filter('date') }})
+        and season in (select season from date_spine)
+    qualify row_number() over (partition by season, team_abv order by date desc) = 1
+    {% endif %}
 ),
 
 -- Forward-fill each metric so every team has a value for every date
@@ -171,8 +215,9 @@ filled_standings as (
                 partition by season, team_abv order by date
                 rows between unbounded preceding and current row
             )
-        ) as {{ col }}{{ ',' if not loop.last }}
+        ) as {{ col }},
         {% endfor %}
+        is_carried_state
     from standings_with_gaps
 )
 
@@ -217,6 +262,7 @@ select
     streak_code,
     streak_count
 from filled_standings
+where not is_carried_state
 order by
     season,
     date,
@@ -9,23 +9,188 @@ in the Airbyte configuration. It supports:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Iterator, Callable
+from typing import Dict, List, Any, Optional, Iterator, Callable, Tuple
 from abc import ABC, abstractmethod
+import json
+import threading
 import time
 import logging
 from dataclasses import dataclass
 
+# Optional fast JSON backends; the stdlib json module is always available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Optional HTTP/2 transport (pip install "httpx[http2]")
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx only negotiates HTTP/2 with the h2 package (the http2 extra) installed
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Brotli decoding is only available to requests/httpx when one of these is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Exceptions raised by either transport: status errors carry .response
+HTTP_STATUS_ERRORS = (requests.exceptions.HTTPError,)
+HTTP_TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    HTTP_STATUS_ERRORS += (httpx.HTTPStatusError,)
+    HTTP_TRANSPORT_ERRORS += (httpx.HTTPError,)
+
+# Exceptions raised by the JSON codecs on a malformed body. Caught by name:
+# requests' InvalidURL/MissingSchema are ValueErrors too, and are not retried
+# as bad JSON.
+JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+if orjson is not None:
+    JSON_DECODE_ERRORS += (orjson.JSONDecodeError,)
+if msgspec is not None:
+    JSON_DECODE_ERRORS += (msgspec.DecodeError,)
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """A JSON decode/encode pair used for API responses and nested columns.
+
+    loads raises one of JSON_DECODE_ERRORS on malformed input.
+    """
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], str]
+
+
+def _build_json_codecs() -> Dict[str, JSONCodec]:
+    """Build the codecs whose backing libraries are installed."""
+    codecs = {
+        'json': JSONCodec(
+            name='json',
+            loads=json.loads,
+            dumps=json.dumps,
+        ),
+    }
+    if msgspec is not None:
+        codecs['msgspec'] = JSONCodec(
+            name='msgspec',
+            loads=msgspec.json.decode,
+            dumps=lambda obj: msgspec.json.encode(obj).decode('utf-8'),
+        )
+    if orjson is not None:
+        codecs['orjson'] = JSONCodec(
+            name='orjson',
+            loads=orjson.loads,
+            dumps=lambda obj: orjson.dumps(obj).decode('utf-8'),
+        )
+    return codecs
+
+
+JSON_CODECS = _build_json_codecs()
+
+# Preference order for 'auto': fastest installed backend first
+JSON_CODEC_PREFERENCE = ['orjson', 'msgspec', 'json']
+
+
+def get_json_codec(name: str = 'auto') -> JSONCodec:
+    """
+    Resolve a JSON codec by name.
+
+    Args:
+        name: 'orjson', 'msgspec', 'json', or 'auto' for the fastest installed backend
+
+    Returns:
+        The matching JSONCodec
+    """
+    if name == 'auto':
+        name = next(n for n in JSON_CODEC_PREFERENCE if n in JSON_CODECS)
+    if name not in JSON_CODECS:
+        raise ValueError(
+            f"JSON codec '{name}' is not available "
+            f"(installed: {', '.join(sorted(JSON_CODECS))})"
+        )
+    return JSON_CODECS[name]
+
+
+# Game-grain streams that return one whole document per game (field_path=[]).
+# In passthrough mode these keep the raw response body instead of parsed dicts.
+PASSTHROUGH_STREAMS = ['game_boxscore', 'game_summaries', 'play_by_play']
+RAW_STREAM_SUFFIX = '_raw'
+
+# Parent stream -> the dependent streams partitioned by its records
+DEPENDENT_STREAMS = {
+    'current_teams': ['team_rosters', 'season_schedules'],
+    'games': PASSTHROUGH_STREAMS,
+}
+
+if msgspec is not None:
+    class _GameKeys(msgspec.Struct):
+        """Top-level keys of a game document; msgspec skips every other field."""
+        id: Optional[int] = None
+        season: Optional[int] = None
+        gameState: Optional[str] = None
+
+    _game_keys_decoder = msgspec.json.Decoder(_GameKeys)
+
+
+def extract_game_keys(raw: bytes, codec: JSONCodec) -> Dict[str, Any]:
+    """
+    Pull season and game state out of a raw game document.
+
+    Uses a typed msgspec decode when available so the rest of the document is
+    never materialized; otherwise falls back to a full decode with the codec.
+    """
+    if msgspec is not None:
+        try:
+            keys = _game_keys_decoder.decode(raw)
+        except msgspec.DecodeError:
+            return {'season': None, 'game_state': None}
+        return {'season': keys.season, 'game_state': keys.gameState}
+
+    try:
+        data = codec.loads(raw)
+    except JSON_DECODE_ERRORS:
+        return {'season': None, 'game_state': None}
+    if not isinstance(data, dict):
+        return {'season': None, 'game_state': None}
+    return {'season': data.get('season'), 'game_state': data.get('gameState')}
+
 
 class NHLAPIClient:
-    """Base client for NHL API with retry logic and rate limiting."""
+    """
+    Base client for NHL API with retry logic and rate limiting.
+
+    Safe to share across threads: the connection pool is sized by pool_size
+    and request pacing is serialized through a lock.
+    """
 
     BASE_URL = "https://api-web.nhle.com/v1"
 
-    def __init__(self, max_retries: int = 5, retry_delay: int = 2, request_delay: float = 0.5):
+    def __init__(self, max_retries: int = 5, retry_delay: int = 2, request_delay: float = 0.5,
+                 json_codec: str = 'auto', pool_size: int = 10, http2: bool = False):
         """
         Initialize NHL API client.
 
@@ -33,30 +198,102 @@ class NHLAPIClient:
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries in seconds
             request_delay: Delay between all requests to avoid rate limiting (seconds)
+            json_codec: JSON backend for decoding responses (see get_json_codec)
+            pool_size: Maximum keep-alive connections held open to the API
+            http2: Use an httpx HTTP/2 client instead of requests
         """
-        self.session = requests.Session()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.request_delay = request_delay
         self.last_request_time = 0
+        self.codec = get_json_codec(json_codec)
+        self.pool_size = pool_size
+        self.http2 = http2
+        self._rate_lock = threading.Lock()
+        self.session = self._build_session()
+        # endpoint -> last error for requests that exhausted their retries
+        self.failures: Dict[str, str] = {}
+        # Failed partitions recorded by the streams (see BaseStream._record_failure)
+        self.dead_letters: List[Dict[str, Any]] = []
+
+    def _build_session(self):
+        """Create the pooled HTTP session (requests, or httpx for HTTP/2)."""
+        encodings = ['gzip', 'deflate'] + (['br'] if BROTLI_AVAILABLE else [])
+        headers = {'Accept-Encoding': ', '.join(encodings)}
+
+        if self.http2:
+            if httpx is None or not H2_AVAILABLE:
+                raise ValueError('http2=True requires httpx with HTTP/2 support: pip install "httpx[http2]"')
+            return httpx.Client(
+                http2=True,
+                # The */now and */current endpoints answer 307; requests follows
+                # redirects by default, httpx does not
+                follow_redirects=True,
+                headers=headers,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            )
+
+        session = requests.Session()
+        session.headers.update(headers)
+        # pool_block: threads wait for a free connection instead of opening
+        # throwaway ones beyond the pool (which defeats keep-alive)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def _wait_for_slot(self):
+        """Reserve the next request slot, sleeping until it comes up."""
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self.last_request_time + self.request_delay)
+            self.last_request_time = slot
+        if slot > now:
+            time.sleep(slot - now)
 
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request with retry logic and rate limiting."""
-        url = f"{self.BASE_URL}/{endpoint}"
+        # Decode the raw body directly; skips requests' text decoding step
+        return self._request(endpoint, params, lambda response: self.codec.loads(response.content))
+
+    def get_raw(self, endpoint: str, params: Optional[Dict] = None) -> Optional[bytes]:
+        """Make GET request and return the undecoded response body."""
+        return self._request(endpoint, params, lambda response: response.content)
 
-        # Add delay between requests to avoid rate limiting
-        if self.request_delay > 0:
-            time_since_last = time.time() - self.last_request_time
-            if time_since_last < self.request_delay:
-                time.sleep(self.request_delay - time_since_last)
+    def pop_failure(self, endpoint: str) -> Optional[str]:
+        """
+        Last error for an endpoint that exhausted its retries, clearing it.
+
+        Lets a caller that got None back tell a failed request from a 404.
+        """
+        return self.failures.pop(endpoint, None)
+
+    def _request(self, endpoint: str, params: Optional[Dict],
+                 parse: Callable[[Any], Any]) -> Any:
+        """Shared retry/rate-limit loop; parse turns a successful response into the result."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        last_error = None
 
         for attempt in range(self.max_retries):
+            # Add delay between requests (retries included) to avoid rate limiting
+            if self.request_delay > 0:
+                self._wait_for_slot()
+
             try:
-                self.last_request_time = time.time()
                 response = self.session.get(url, params=params, timeout=30)
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.HTTPError as e:
+                return parse(response)
+            except JSON_DECODE_ERRORS as e:
+                last_error = f"Invalid JSON: {e}"
+                logger.warning(f"Invalid JSON on attempt {attempt + 1}: {e}")
+            except HTTP_STATUS_ERRORS as e:
+                last_error = str(e)
                 if e.response.status_code == 404:
                     logger.warning(f"404 Not Found: {url}")
                     return None
@@ -69,7 +306,8 @@ class NHLAPIClient:
                     continue
                 else:
                     logger.warning(f"HTTP error on attempt {attempt + 1}: {e}")
-            except requests.exceptions.RequestException as e:
+            except HTTP_TRANSPORT_ERRORS as e:
+                last_error = str(e)
                 logger.warning(f"Request error on attempt {attempt + 1}: {e}")
 
             if attempt < self.max_retries - 1:
@@ -78,6 +316,7 @@ class NHLAPIClient:
                 time.sleep(wait_time)
 
         logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
+        self.failures[endpoint] = last_error
         return None
 
     def extract_field(self, data: Dict[str, Any], field_path: List[str]) -> Any:
@@ -134,6 +373,30 @@ class BaseStream(ABC):
         # If extracted is a list, return it; otherwise wrap in list
         return extracted if isinstance(extracted, list) else [extracted]
 
+    def _record_failure(self, endpoint: str, partition_value: Any = None, raw: bool = False):
+        """
+        Add a dead letter if the client gave up on endpoint.
+
+        Called after a request returned nothing; a 404 (no data for the
+        partition) is not a failure and records nothing.
+        """
+        error = self.client.pop_failure(endpoint)
+        if error is None:
+            return
+
+        stream_name = f"{self.config.name}{RAW_STREAM_SUFFIX}" if raw else self.config.name
+        partition_field = getattr(self, 'partition_field', None)
+        self.client.dead_letters.append({
+            'stream': stream_name,
+            'endpoint': endpoint,
+            'partition_field': partition_field,
+            'partition_value': partition_value,
+            'error': error,
+            'failed_at': datetime.now().isoformat(),
+        })
+        partition = f" ({partition_field}={partition_value})" if partition_field else ""
+        logger.warning(f"Dead-lettered {stream_name}{partition}: {error}")
+
 
 class SimpleStream(BaseStream):
     """Stream that makes a single API call."""
@@ -147,10 +410,20 @@ class SimpleStream(BaseStream):
             records = self._extract_records(data)
             logger.info(f"Retrieved {len(records)} records from {self.config.name}")
             yield from records
+        else:
+            self._record_failure(self.config.endpoint_template)
 
 
-class IncrementalStream(BaseStream):
-    """Stream that iterates over date ranges."""
+class BaseIncrementalStream(BaseStream):
+    """
+    Stream over a date range, one request per date.
+
+    Holds the range and the per-date endpoint and record tagging; subclasses
+    decide how the requests are made (IncrementalStream, AsyncIncrementalStream).
+    """
+
+    # Field added to every record; partitions are dates
+    partition_field = 'date'
 
     def __init__(self, client: NHLAPIClient, config: StreamConfig,
                  start_date: str, end_date: Optional[str] = None,
@@ -160,34 +433,62 @@ class IncrementalStream(BaseStream):
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.now()
         self.step_days = step_days
 
+    def _partition_values(self) -> List[str]:
+        """Dates (YYYY-MM-DD) in the range, step_days apart."""
+        dates = []
+        current_date = self.start_date
+        while current_date <= self.end_date:
+            dates.append(current_date.strftime("%Y-%m-%d"))
+            current_date += timedelta(days=self.step_days)
+        return dates
+
+    def _endpoint(self, date_str: str) -> str:
+        return self.config.endpoint_template.format(date=date_str)
+
+    def _partition_records(self, date_str: str, data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Records of one date's response, tagged with the date (dead-letters an empty response)."""
+        if not data:
+            self._record_failure(self._endpoint(date_str), date_str)
+            return []
+
+        records = []
+        # Add date field to each record
+        for record in self._extract_records(data):
+            if isinstance(record, dict):
+                record['date'] = date_str
+                records.append(record)
+        return records
+
+
+class IncrementalStream(BaseIncrementalStream):
+    """Stream that iterates over date ranges."""
+
     def read_records(self, **kwargs) -> Iterator[Dict[str, Any]]:
         """Fetch data for each date in the range."""
         logger.info(f"Fetching {self.config.name} from {self.start_date.date()} to {self.end_date.date()}...")
 
-        current_date = self.start_date
         total_records = 0
 
-        while current_date <= self.end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            endpoint = self.config.endpoint_template.format(date=date_str)
-
-            data = self.client.get(endpoint)
-            if data:
-                records = self._extract_records(data)
-                # Add date field to each record
-                for record in records:
-                    if isinstance(record, dict):
-                        record['date'] = date_str
-                        yield record
-                        total_records += 1
-
-            current_date += timedelta(days=self.step_days)
+        for date_str in self._partition_values():
+            for record in self.read_partition(date_str):
+                yield record
+                total_records += 1
 
         logger.info(f"Retrieved {total_records} total records from {self.config.name}")
 
+    def read_partition(self, date_str: str) -> Iterator[Dict[str, Any]]:
+        """Fetch a single date (YYYY-MM-DD)."""
+        yield from self._partition_records(date_str, self.client.get(self._endpoint(date_str)))
 
-class DependentStream(BaseStream):
-    """Stream that depends on data from a parent stream."""
+
+class BaseDependentStream(BaseStream):
+    """
+    Stream with one request per partition value taken from a parent stream.
+
+    Holds the parent wiring and the per-partition endpoint and record tagging;
+    subclasses decide how the requests are made (DependentStream,
+    AsyncDependentStream).
+    """
 
     def __init__(self, client: NHLAPIClient, config: StreamConfig,
                  parent_stream: BaseStream, parent_key: str,
@@ -197,6 +498,45 @@ class DependentStream(BaseStream):
         self.parent_key = parent_key
         self.partition_field = partition_field
 
+    def _parent_partition_values(self, parent_records: List[Dict]) -> List[Any]:
+        """Partition values of the parent records, skipping records without one."""
+        return [r.get(self.parent_key) for r in parent_records if r.get(self.parent_key) is not None]
+
+    def _endpoint(self, partition_value: Any) -> str:
+        return self.config.endpoint_template.format(**{self.partition_field: partition_value})
+
+    def _check_raw(self):
+        if self.config.field_path:
+            raise ValueError(f"Stream {self.config.name} extracts a sub-path and cannot be read raw")
+
+    def _partition_records(self, partition_value: Any, data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Records of one partition's response, tagged with the partition value."""
+        if not data:
+            self._record_failure(self._endpoint(partition_value), partition_value)
+            return []
+
+        records = self._extract_records(data)
+        # Add the partition value to each record (e.g., team_abv for rosters)
+        for record in records:
+            if isinstance(record, dict):
+                record[self.partition_field] = partition_value
+        return records
+
+    def _raw_partition_record(self, partition_value: Any, raw: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        """Raw record for one partition's response body (None if there is no data)."""
+        if not raw:
+            self._record_failure(self._endpoint(partition_value), partition_value, raw=True)
+            return None
+
+        record = {self.partition_field: partition_value}
+        record.update(extract_game_keys(raw, self.client.codec))
+        record['payload'] = raw
+        return record
+
+
+class DependentStream(BaseDependentStream):
+    """Stream that depends on data from a parent stream."""
+
     def read_records(self, parent_records: Optional[List[Dict]] = None, **kwargs) -> Iterator[Dict[str, Any]]:
         """Fetch data for each partition from parent stream."""
         logger.info(f"Fetching {self.config.name} (depends on {self.parent_stream.config.name})...")
@@ -207,28 +547,59 @@ class DependentStream(BaseStream):
 
         total_records = 0
 
-        for parent_record in parent_records:
-            partition_value = parent_record.get(self.parent_key)
-            if partition_value is None:
-                continue
+        for partition_value in self._parent_partition_values(parent_records):
+            for record in self.read_partition(partition_value):
+                yield record
+                total_records += 1
 
-            endpoint = self.config.endpoint_template.format(**{self.partition_field: partition_value})
+        logger.info(f"Retrieved {total_records} total records from {self.config.name}")
 
-            data = self.client.get(endpoint)
-            if data:
-                records = self._extract_records(data)
-                # Add the partition value to each record (e.g., team_abv for rosters)
-                for record in records:
-                    if isinstance(record, dict):
-                        record[self.partition_field] = partition_value
-                    yield record
-                total_records += len(records)
+    def read_partition(self, partition_value: Any) -> Iterator[Dict[str, Any]]:
+        """Fetch a single partition (e.g. one game_id or team_abv)."""
+        yield from self._partition_records(partition_value, self.client.get(self._endpoint(partition_value)))
 
-        logger.info(f"Retrieved {total_records} total records from {self.config.name}")
+    def read_raw_records(self, parent_records: Optional[List[Dict]] = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch each partition without parsing the response body.
 
+        Only valid for whole-document streams (empty field_path). Yields one
+        record per partition with the partition value, season, game state and
+        the raw JSON payload as bytes.
+        """
+        self._check_raw()
 
-class NHLExtractor:
-    """Main extractor class that orchestrates all streams."""
+        logger.info(f"Fetching {self.config.name} raw (depends on {self.parent_stream.config.name})...")
+
+        if parent_records is None:
+            parent_records = list(self.parent_stream.read_records(**kwargs))
+
+        total_records = 0
+
+        for partition_value in self._parent_partition_values(parent_records):
+            record = self.read_raw_partition(partition_value)
+            if record is not None:
+                yield record
+                total_records += 1
+
+        logger.info(f"Retrieved {total_records} total raw records from {self.config.name}")
+
+    def read_raw_partition(self, partition_value: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single partition without parsing it (None if there is no data)."""
+        return self._raw_partition_record(partition_value, self.client.get_raw(self._endpoint(partition_value)))
+
+
+class BaseNHLExtractor(ABC):
+    """
+    Stream wiring, parent cache and dead-letter bookkeeping shared by
+    NHLExtractor and AsyncNHLExtractor.
+
+    Subclasses pick the client and stream classes and implement the reads.
+    """
+
+    client_class: type
+    simple_stream_class: type
+    incremental_stream_class: type
+    dependent_stream_class: type
 
     def __init__(
         self,
@@ -236,7 +607,10 @@ class NHLExtractor:
         end_date: Optional[str] = None,
         max_retries: int = 5,
         retry_delay: int = 2,
-        request_delay: float = 0.5
+        request_delay: float = 0.5,
+        json_codec: str = 'auto',
+        pool_size: int = 10,
+        http2: bool = False
     ):
         """
         Initialize NHL extractor.
@@ -247,21 +621,36 @@ class NHLExtractor:
             max_retries: Maximum retry attempts for failed requests
             retry_delay: Base delay between retries (seconds)
             request_delay: Delay between all requests to avoid rate limiting (seconds)
+            json_codec: JSON backend for decoding responses ('auto', 'orjson', 'msgspec', 'json')
+            pool_size: Maximum keep-alive connections held open to the API
+            http2: Use an httpx HTTP/2 client instead of requests
         """
-        self.client = NHLAPIClient(
+        self.client = self.client_class(
             max_retries=max_retries,
             retry_delay=retry_delay,
-            request_delay=request_delay
+            request_delay=request_delay,
+            json_codec=json_codec,
+            pool_size=pool_size,
+            http2=http2
         )
         self.start_date = start_date or (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
         self.end_date = end_date or datetime.now().strftime("%Y-%m-%d")
         self._setup_streams()
 
+        # Parent stream -> fields its dependent streams partition on. Parent
+        # output is cached reduced to these fields, so each parent is crawled
+        # at most once per extractor however its dependents are extracted.
+        self._parent_fields = {
+            parent: tuple(sorted({self._stream(child).parent_key for child in children}))
+            for parent, children in DEPENDENT_STREAMS.items()
+        }
+        self._parent_keys: Dict[str, List[Tuple]] = {}
+
     def _setup_streams(self):
         """Configure all NHL data streams."""
 
         # Simple streams - no dependencies
-        self.current_standings_stream = SimpleStream(
+        self.current_standings_stream = self.simple_stream_class(
             self.client,
             StreamConfig(
                 name="current_standings",
@@ -270,7 +659,7 @@ class NHLExtractor:
             )
         )
 
-        self.current_teams_stream = SimpleStream(
+        self.current_teams_stream = self.simple_stream_class(
             self.client,
             StreamConfig(
                 name="current_teams",
@@ -280,7 +669,7 @@ class NHLExtractor:
         )
 
         # Incremental streams - date-based
-        self.games_stream = IncrementalStream(
+        self.games_stream = self.incremental_stream_class(
             self.client,
             StreamConfig(
                 name="games",
@@ -291,7 +680,7 @@ class NHLExtractor:
             end_date=self.end_date
         )
 
-        self.daily_standings_stream = IncrementalStream(
+        self.daily_standings_stream = self.incremental_stream_class(
             self.client,
             StreamConfig(
                 name="daily_standings",
@@ -303,7 +692,7 @@ class NHLExtractor:
         )
 
         # Dependent streams - require parent data
-        self.team_rosters_stream = DependentStream(
+        self.team_rosters_stream = self.dependent_stream_class(
             self.client,
             StreamConfig(
                 name="team_rosters",
@@ -315,7 +704,7 @@ class NHLExtractor:
             partition_field="team_abv"
         )
 
-        self.season_schedules_stream = DependentStream(
+        self.season_schedules_stream = self.dependent_stream_class(
             self.client,
             StreamConfig(
                 name="season_schedules",
@@ -327,7 +716,7 @@ class NHLExtractor:
             partition_field="team_abv"
         )
 
-        self.game_boxscore_stream = DependentStream(
+        self.game_boxscore_stream = self.dependent_stream_class(
             self.client,
             StreamConfig(
                 name="game_boxscore",
@@ -339,7 +728,7 @@ class NHLExtractor:
             partition_field="game_id"
         )
 
-        self.game_summaries_stream = DependentStream(
+        self.game_summaries_stream = self.dependent_stream_class(
             self.client,
             StreamConfig(
                 name="game_summaries",
@@ -351,7 +740,7 @@ class NHLExtractor:
             partition_field="game_id"
         )
 
-        self.play_by_play_stream = DependentStream(
+        self.play_by_play_stream = self.dependent_stream_class(
             self.client,
             StreamConfig(
                 name="play_by_play",
@@ -363,70 +752,248 @@ class NHLExtractor:
             partition_field="game_id"
         )
 
-    def extract_stream(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
-        """Extract data from a specific stream."""
+    def _stream(self, stream_name: str) -> BaseStream:
         stream = getattr(self, f"{stream_name}_stream", None)
         if stream is None:
             raise ValueError(f"Unknown stream: {stream_name}")
+        return stream
+
+    @property
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        """Partitions whose requests exhausted their retries during this run."""
+        return self.client.dead_letters
+
+    def partition_field(self, stream_name: str) -> Optional[str]:
+        """Field identifying a stream's partitions ('date', 'game_id', ...; None for simple streams)."""
+        if stream_name.endswith(RAW_STREAM_SUFFIX):
+            stream_name = stream_name[:-len(RAW_STREAM_SUFFIX)]
+        return getattr(self._stream(stream_name), 'partition_field', None)
+
+    def _read_parent(self, stream_name: str, records: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass a parent stream's records through, caching their keys once the stream completes."""
+        fields = self._parent_fields[stream_name]
+        keys = {}
+        for record in records:
+            keys[tuple(record.get(field) for field in fields)] = None
+            yield record
+        self._parent_keys[stream_name] = list(keys)
+
+    def _cached_parent_records(self, stream_name: str) -> List[Dict[str, Any]]:
+        fields = self._parent_fields[stream_name]
+        return [dict(zip(fields, key)) for key in self._parent_keys[stream_name]]
+
+    def _check_passthrough(self, stream_name: str):
+        if stream_name not in PASSTHROUGH_STREAMS:
+            raise ValueError(f"Stream {stream_name} does not support passthrough")
+
+    def _unique_dead_letters(self, dead_letters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Dead letters with repeats of the same stream partition dropped, in order."""
+        unique = {}
+        for letter in dead_letters:
+            unique.setdefault((letter['stream'], letter.get('partition_value')), letter)
+        return list(unique.values())
+
+    def _retry_dependents(self, stream_name: str, passthrough: bool) -> List[Tuple[str, BaseDependentStream, bool]]:
+        """(result key, stream, raw) for each dependent of a retried parent stream."""
+        dependents = []
+        for child_name in DEPENDENT_STREAMS.get(stream_name, []):
+            raw = passthrough and child_name in PASSTHROUGH_STREAMS
+            key = f"{child_name}{RAW_STREAM_SUFFIX}" if raw else child_name
+            dependents.append((key, self._stream(child_name), raw))
+        return dependents
+
+    @abstractmethod
+    def parent_records(self, stream_name: str) -> List[Dict[str, Any]]:
+        """A parent stream's output for its dependent streams."""
+        pass
+
+    @abstractmethod
+    def extract_stream(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """Extract data from a specific stream."""
+        pass
+
+    @abstractmethod
+    def extract_stream_raw(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """Extract a passthrough stream as raw payload records."""
+        pass
+
+    @abstractmethod
+    def extract_all(self, include_dependent: bool = True,
+                    passthrough: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Extract data from all streams."""
+        pass
+
+    @abstractmethod
+    def retry_dead_letters(self, dead_letters: List[Dict[str, Any]], include_dependent: bool = True,
+                           passthrough: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Re-fetch only the partitions recorded in dead_letters."""
+        pass
+
+
+class NHLExtractor(BaseNHLExtractor):
+    """Main extractor class that orchestrates all streams."""
+
+    client_class = NHLAPIClient
+    simple_stream_class = SimpleStream
+    incremental_stream_class = IncrementalStream
+    dependent_stream_class = DependentStream
+
+    def parent_records(self, stream_name: str) -> List[Dict[str, Any]]:
+        """
+        A parent stream's output for its dependent streams.
+
+        Reads the parent on first use and caches only the distinct partition
+        keys (e.g. {'id': 2024020001} per game), not the full records.
+        """
+        if stream_name not in self._parent_keys:
+            for _ in self._read_parent(stream_name, self._stream(stream_name).read_records()):
+                pass
+        return self._cached_parent_records(stream_name)
+
+    def _read_stream(self, stream_name: str, raw: bool = False, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Read a stream, sharing parent reads through the parent cache."""
+        stream = self._stream(stream_name)
+        if isinstance(stream, DependentStream) and kwargs.get('parent_records') is None:
+            kwargs['parent_records'] = self.parent_records(stream.parent_stream.config.name)
+
+        records = stream.read_raw_records(**kwargs) if raw else stream.read_records(**kwargs)
+        if stream_name in self._parent_fields:
+            records = self._read_parent(stream_name, records)
+        return records
 
-        return list(stream.read_records(**kwargs))
+    def extract_stream(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """Extract data from a specific stream."""
+        return list(self._read_stream(stream_name, **kwargs))
+
+    def extract_stream_raw(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """Extract a passthrough stream as raw payload records (see DependentStream.read_raw_records)."""
+        self._check_passthrough(stream_name)
 
-    def extract_all(self, include_dependent: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+        return list(self._read_stream(stream_name, raw=True, **kwargs))
+
+    def extract_all(self, include_dependent: bool = True,
+                    passthrough: bool = False) -> Dict[str, List[Dict[str, Any]]]:
         """
         Extract data from all streams.
 
         Args:
             include_dependent: Whether to include dependent streams (can be slow)
+            passthrough: Keep raw response bodies for PASSTHROUGH_STREAMS instead of
+                parsing them; their results are keyed '<stream>_raw'
 
         Returns:
             Dictionary mapping stream names to their records
         """
         results = {}
+        for stream_name, records in self.iter_batches(include_dependent, passthrough):
+            results.setdefault(stream_name, []).extend(records)
+        return results
+
+    def iter_batches(self, include_dependent: bool = True, passthrough: bool = False,
+                     batch_size: Optional[int] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Extract all streams in order, yielding records as they arrive.
+
+        Lets a consumer (e.g. nhl_to_snowflake.py) start loading a stream while
+        later streams are still being extracted.
+
+        Args:
+            include_dependent: Whether to include dependent streams (can be slow)
+            passthrough: Keep raw response bodies for PASSTHROUGH_STREAMS (see extract_all)
+            batch_size: Maximum records per yielded batch. None yields each
+                stream exactly once, as a single (possibly empty) list.
+
+        Yields:
+            (stream_name, records) tuples
+        """
+        def batches(stream_name, records):
+            if batch_size is None:
+                yield stream_name, list(records)
+                return
+
+            batch = []
+            for record in records:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    yield stream_name, batch
+                    batch = []
+            if batch:
+                yield stream_name, batch
 
         # Extract simple streams
         logger.info("=" * 60)
         logger.info("Extracting simple streams...")
         logger.info("=" * 60)
-        results['current_standings'] = self.extract_stream('current_standings')
-        results['current_teams'] = self.extract_stream('current_teams')
+        yield from batches('current_standings', self._stream('current_standings').read_records())
+        yield from batches('current_teams', self._read_stream('current_teams'))
 
         # Extract incremental streams
         logger.info("=" * 60)
         logger.info("Extracting incremental streams...")
         logger.info("=" * 60)
-        results['games'] = self.extract_stream('games')
-        results['daily_standings'] = self.extract_stream('daily_standings')
-
-        if include_dependent:
-            # Extract dependent streams that use current_teams
-            logger.info("=" * 60)
-            logger.info("Extracting team-dependent streams...")
-            logger.info("=" * 60)
-            results['team_rosters'] = self.extract_stream(
-                'team_rosters',
-                parent_records=results['current_teams']
-            )
-            results['season_schedules'] = self.extract_stream(
-                'season_schedules',
-                parent_records=results['current_teams']
-            )
+        yield from batches('games', self._read_stream('games'))
+        yield from batches('daily_standings', self._stream('daily_standings').read_records())
 
-            # Extract dependent streams that use games
-            logger.info("=" * 60)
-            logger.info("Extracting game-dependent streams...")
-            logger.info("=" * 60)
-            results['game_boxscore'] = self.extract_stream(
-                'game_boxscore',
-                parent_records=results['games']
-            )
-            results['game_summaries'] = self.extract_stream(
-                'game_summaries',
-                parent_records=results['games']
-            )
-            results['play_by_play'] = self.extract_stream(
-                'play_by_play',
-                parent_records=results['games']
-            )
+        if not include_dependent:
+            return
+
+        # Extract dependent streams that use current_teams
+        logger.info("=" * 60)
+        logger.info("Extracting team-dependent streams...")
+        logger.info("=" * 60)
+        for stream_name in DEPENDENT_STREAMS['current_teams']:
+            yield from batches(stream_name, self._read_stream(stream_name))
+
+        # Extract dependent streams that use games
+        logger.info("=" * 60)
+        logger.info("Extracting game-dependent streams...")
+        logger.info("=" * 60)
+        for stream_name in DEPENDENT_STREAMS['games']:
+            if passthrough:
+                yield from batches(f"{stream_name}{RAW_STREAM_SUFFIX}", self._read_stream(stream_name, raw=True))
+            else:
+                yield from batches(stream_name, self._read_stream(stream_name))
+
+    def retry_dead_letters(self, dead_letters: List[Dict[str, Any]], include_dependent: bool = True,
+                           passthrough: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Re-fetch only the partitions recorded in dead_letters.
+
+        Dependent streams never ran for the records of a failed parent
+        partition (e.g. the games of a failed score/{date}), so they are
+        fetched for whatever the retried parent returns. Partitions that fail
+        again are dead-lettered anew in self.dead_letters.
+
+        Args:
+            dead_letters: Dead letters from a previous run (see self.dead_letters)
+            include_dependent: Fetch dependent streams for recovered parent records
+            passthrough: Fetch those dependents raw (see extract_all)
+
+        Returns:
+            Dictionary mapping stream names to the recovered records
+        """
+        results = {}
+
+        for letter in self._unique_dead_letters(dead_letters):
+            stream_name = letter['stream']
+            partition_value = letter.get('partition_value')
+
+            logger.info(f"Retrying {letter['endpoint']}...")
+            if stream_name.endswith(RAW_STREAM_SUFFIX):
+                stream = self._stream(stream_name[:-len(RAW_STREAM_SUFFIX)])
+                record = stream.read_raw_partition(partition_value)
+                records = [record] if record is not None else []
+            elif partition_value is None:
+                records = list(self._stream(stream_name).read_records())
+            else:
+                records = list(self._stream(stream_name).read_partition(partition_value))
+            results.setdefault(stream_name, []).extend(records)
+
+            if not (include_dependent and records):
+                continue
+            for child_key, child, raw in self._retry_dependents(stream_name, passthrough):
+                read = child.read_raw_records if raw else child.read_records
+                results.setdefault(child_key, []).extend(read(parent_records=records))
 
         return results
 
@@ -0,0 +1,435 @@
+"""
+NHL Data Extractor - asyncio variant
+
+Async counterparts of the client and streams in nhl_extractor.py. Streams are
+async generators (`async for record in stream.read_records()`), every request
+goes through one shared async rate limiter, and AsyncNHLExtractor.extract_all
+runs all independent streams concurrently in a single event loop.
+
+Requires httpx (pip install httpx, or "httpx[http2]" for HTTP/2).
+
+Usage:
+    import asyncio
+    from nhl_extractor_async import AsyncNHLExtractor
+
+    async def main():
+        async with AsyncNHLExtractor(start_date="2024-11-04", end_date="2024-11-07") as extractor:
+            async for game in extractor.games_stream.read_records():
+                ...
+            all_data = await extractor.extract_all()
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from nhl_extractor import (
+    BROTLI_AVAILABLE,
+    H2_AVAILABLE,
+    JSON_DECODE_ERRORS,
+    PASSTHROUGH_STREAMS,
+    RAW_STREAM_SUFFIX,
+    BaseDependentStream,
+    BaseIncrementalStream,
+    BaseNHLExtractor,
+    BaseStream,
+    NHLAPIClient,
+    get_json_codec,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """Spaces request start times at least request_delay apart across all tasks."""
+
+    def __init__(self, request_delay: float):
+        self.request_delay = request_delay
+        self.last_request_time = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Reserve the next request slot, sleeping until it comes up."""
+        if self.request_delay <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.last_request_time + self.request_delay)
+            self.last_request_time = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncNHLAPIClient:
+    """Async NHL API client with the same retry and rate-limit behavior as NHLAPIClient."""
+
+    BASE_URL = NHLAPIClient.BASE_URL
+
+    # Field extraction and failure bookkeeping are pure; reuse the sync implementation
+    extract_field = NHLAPIClient.extract_field
+    pop_failure = NHLAPIClient.pop_failure
+
+    def __init__(self, max_retries: int = 5, retry_delay: int = 2, request_delay: float = 0.5,
+                 json_codec: str = 'auto', pool_size: int = 10, http2: bool = False):
+        """
+        Initialize async NHL API client.
+
+        Args:
+            max_retries: Maximum number of retry attempts
+            retry_delay: Base delay between retries in seconds
+            request_delay: Delay between all requests to avoid rate limiting (seconds)
+            json_codec: JSON backend for decoding responses (see get_json_codec)
+            pool_size: Maximum concurrent requests / keep-alive connections
+            http2: Negotiate HTTP/2 (requires httpx[http2])
+        """
+        if httpx is None:
+            raise ValueError('AsyncNHLAPIClient requires httpx: pip install httpx')
+        if http2 and not H2_AVAILABLE:
+            raise ValueError('http2=True requires httpx with HTTP/2 support: pip install "httpx[http2]"')
+
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.codec = get_json_codec(json_codec)
+        self.pool_size = pool_size
+        self.rate_limiter = AsyncRateLimiter(request_delay)
+        self._semaphore = asyncio.Semaphore(pool_size)
+        self.failures: Dict[str, str] = {}
+        self.dead_letters: List[Dict[str, Any]] = []
+
+        encodings = ['gzip', 'deflate'] + (['br'] if BROTLI_AVAILABLE else [])
+        self.session = httpx.AsyncClient(
+            http2=http2,
+            # The */now and */current endpoints answer 307
+            follow_redirects=True,
+            headers={'Accept-Encoding': ', '.join(encodings)},
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+            ),
+        )
+
+    async def aclose(self):
+        """Close pooled connections."""
+        await self.session.aclose()
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request with retry logic and rate limiting."""
+        return await self._request(endpoint, params, lambda response: self.codec.loads(response.content))
+
+    async def get_raw(self, endpoint: str, params: Optional[Dict] = None) -> Optional[bytes]:
+        """Make GET request and return the undecoded response body."""
+        return await self._request(endpoint, params, lambda response: response.content)
+
+    async def _request(self, endpoint: str, params: Optional[Dict],
+                       parse: Callable[[Any], Any]) -> Any:
+        """Shared retry/rate-limit loop; parse turns a successful response into the result."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        last_error = None
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries):
+                # Retries take a rate-limit slot like any other request
+                await self.rate_limiter.wait()
+
+                try:
+                    response = await self.session.get(url, params=params, timeout=30)
+                    response.raise_for_status()
+                    return parse(response)
+                except JSON_DECODE_ERRORS as e:
+                    last_error = f"Invalid JSON: {e}"
+                    logger.warning(f"Invalid JSON on attempt {attempt + 1}: {e}")
+                except httpx.HTTPStatusError as e:
+                    last_error = str(e)
+                    if e.response.status_code == 404:
+                        logger.warning(f"404 Not Found: {url}")
+                        return None
+                    elif e.response.status_code == 429:
+                        # Rate limited - use exponential backoff with longer delays
+                        wait_time = self.retry_delay * (2 ** attempt) * 2  # Double the wait for 429
+                        logger.warning(f"HTTP 429 Rate Limited on attempt {attempt + 1}. Waiting {wait_time}s before retry...")
+                        if attempt < self.max_retries - 1:
+                            await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        logger.warning(f"HTTP error on attempt {attempt + 1}: {e}")
+                except httpx.HTTPError as e:
+                    last_error = str(e)
+                    logger.warning(f"Request error on attempt {attempt + 1}: {e}")
+
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff
+                    wait_time = self.retry_delay * (attempt + 1)
+                    await asyncio.sleep(wait_time)
+
+        logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
+        self.failures[endpoint] = last_error
+        return None
+
+
+async def _fetch_in_order(fetches: List[Awaitable[Any]]) -> AsyncIterator[Any]:
+    """
+    Run fetches concurrently and yield their results in submission order.
+
+    Concurrency is bounded by the client's semaphore; any fetches still pending
+    when the consumer stops iterating are cancelled.
+    """
+    tasks = [asyncio.ensure_future(fetch) for fetch in fetches]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class AsyncSimpleStream(BaseStream):
+    """Async stream that makes a single API call."""
+
+    async def read_records(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch data from a simple endpoint."""
+        logger.info(f"Fetching {self.config.name}...")
+
+        data = await self.client.get(self.config.endpoint_template)
+        if data:
+            records = self._extract_records(data)
+            logger.info(f"Retrieved {len(records)} records from {self.config.name}")
+            for record in records:
+                yield record
+        else:
+            self._record_failure(self.config.endpoint_template)
+
+
+class AsyncIncrementalStream(BaseIncrementalStream):
+    """Async stream that fetches every date in the range concurrently."""
+
+    async def read_records(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch data for each date in the range."""
+        logger.info(f"Fetching {self.config.name} from {self.start_date.date()} to {self.end_date.date()}...")
+
+        total_records = 0
+
+        async for records in _fetch_in_order([self._fetch_partition(d) for d in self._partition_values()]):
+            for record in records:
+                yield record
+            total_records += len(records)
+
+        logger.info(f"Retrieved {total_records} total records from {self.config.name}")
+
+    async def read_partition(self, date_str: str) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch a single date (YYYY-MM-DD)."""
+        for record in await self._fetch_partition(date_str):
+            yield record
+
+    async def _fetch_partition(self, date_str: str) -> List[Dict[str, Any]]:
+        return self._partition_records(date_str, await self.client.get(self._endpoint(date_str)))
+
+
+class AsyncDependentStream(BaseDependentStream):
+    """Async stream that fetches every parent partition concurrently."""
+
+    async def _partition_values(self, parent_records: Optional[List[Dict]], **kwargs) -> List[Any]:
+        """Resolve partition values, reading the parent stream if records weren't passed."""
+        if parent_records is None:
+            parent_records = [record async for record in self.parent_stream.read_records(**kwargs)]
+        return self._parent_partition_values(parent_records)
+
+    async def read_records(self, parent_records: Optional[List[Dict]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch data for each partition from parent stream."""
+        logger.info(f"Fetching {self.config.name} (depends on {self.parent_stream.config.name})...")
+
+        partition_values = await self._partition_values(parent_records, **kwargs)
+        total_records = 0
+
+        async for records in _fetch_in_order([self._fetch_partition(value) for value in partition_values]):
+            for record in records:
+                yield record
+            total_records += len(records)
+
+        logger.info(f"Retrieved {total_records} total records from {self.config.name}")
+
+    async def read_partition(self, partition_value: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch a single partition (e.g. one game_id or team_abv)."""
+        for record in await self._fetch_partition(partition_value):
+            yield record
+
+    async def _fetch_partition(self, partition_value: Any) -> List[Dict[str, Any]]:
+        return self._partition_records(partition_value, await self.client.get(self._endpoint(partition_value)))
+
+    async def read_raw_records(self, parent_records: Optional[List[Dict]] = None, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch each partition without parsing the response body (see DependentStream.read_raw_records)."""
+        self._check_raw()
+
+        logger.info(f"Fetching {self.config.name} raw (depends on {self.parent_stream.config.name})...")
+
+        partition_values = await self._partition_values(parent_records, **kwargs)
+        total_records = 0
+
+        async for record in _fetch_in_order([self.read_raw_partition(value) for value in partition_values]):
+            if record is not None:
+                yield record
+                total_records += 1
+
+        logger.info(f"Retrieved {total_records} total raw records from {self.config.name}")
+
+    async def read_raw_partition(self, partition_value: Any) -> Optional[Dict[str, Any]]:
+        """Fetch a single partition without parsing it (None if there is no data)."""
+        return self._raw_partition_record(partition_value, await self.client.get_raw(self._endpoint(partition_value)))
+
+
+class AsyncNHLExtractor(BaseNHLExtractor):
+    """
+    Async extractor with the same streams and options as NHLExtractor.
+
+    Covers extract_stream, extract_stream_raw, extract_all and
+    retry_dead_letters; batch-by-batch streaming (iter_batches) is left to the
+    sequential NHLExtractor. Use `async with` (or `await extractor.aclose()`)
+    to release connections.
+    """
+
+    client_class = AsyncNHLAPIClient
+    simple_stream_class = AsyncSimpleStream
+    incremental_stream_class = AsyncIncrementalStream
+    dependent_stream_class = AsyncDependentStream
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._parent_locks: Dict[str, asyncio.Lock] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close pooled connections."""
+        await self.client.aclose()
+
+    async def parent_records(self, stream_name: str) -> List[Dict[str, Any]]:
+        """Cached parent output for dependent streams (see NHLExtractor.parent_records)."""
+        # Concurrent dependents of the same parent wait for one crawl
+        async with self._parent_locks.setdefault(stream_name, asyncio.Lock()):
+            if stream_name not in self._parent_keys:
+                await self.extract_stream(stream_name)
+        return self._cached_parent_records(stream_name)
+
+    async def _extract(self, stream_name: str, raw: bool = False, **kwargs) -> List[Dict[str, Any]]:
+        stream = self._stream(stream_name)
+        if isinstance(stream, AsyncDependentStream) and kwargs.get('parent_records') is None:
+            kwargs['parent_records'] = await self.parent_records(stream.parent_stream.config.name)
+
+        read = stream.read_raw_records if raw else stream.read_records
+        records = [record async for record in read(**kwargs)]
+        if stream_name in self._parent_fields:
+            records = list(self._read_parent(stream_name, records))
+        return records
+
+    async def extract_stream(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """Extract data from a specific stream."""
+        return await self._extract(stream_name, **kwargs)
+
+    async def extract_stream_raw(self, stream_name: str, **kwargs) -> List[Dict[str, Any]]:
+        """Extract a passthrough stream as raw payload records."""
+        self._check_passthrough(stream_name)
+
+        return await self._extract(stream_name, raw=True, **kwargs)
+
+    async def extract_all(self, include_dependent: bool = True,
+                          passthrough: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract data from all streams concurrently.
+
+        Independent streams run side by side; each dependent stream starts as
+        soon as its own parent finishes. Arguments and result keys match
+        NHLExtractor.extract_all.
+        """
+        results = {}
+
+        async def extract_into(stream_name: str, **kwargs):
+            results[stream_name] = await self.extract_stream(stream_name, **kwargs)
+
+        async def extract_raw_into(stream_name: str, **kwargs):
+            results[f"{stream_name}{RAW_STREAM_SUFFIX}"] = await self.extract_stream_raw(stream_name, **kwargs)
+
+        async def teams_then_dependents():
+            await extract_into('current_teams')
+            if include_dependent:
+                await asyncio.gather(
+                    extract_into('team_rosters'),
+                    extract_into('season_schedules'),
+                )
+
+        async def games_then_dependents():
+            await extract_into('games')
+            if include_dependent:
+                extract = extract_raw_into if passthrough else extract_into
+                await asyncio.gather(*[
+                    extract(stream_name)
+                    for stream_name in PASSTHROUGH_STREAMS
+                ])
+
+        logger.info("=" * 60)
+        logger.info("Extracting all streams concurrently...")
+        logger.info("=" * 60)
+        await asyncio.gather(
+            extract_into('current_standings'),
+            extract_into('daily_standings'),
+            teams_then_dependents(),
+            games_then_dependents(),
+        )
+
+        # Same key order as the sequential extractor, regardless of finish order
+        order = ['current_standings', 'current_teams', 'games', 'daily_standings',
+                 'team_rosters', 'season_schedules']
+        order += [f"{name}{RAW_STREAM_SUFFIX}" if passthrough else name for name in PASSTHROUGH_STREAMS]
+        return {name: results[name] for name in order if name in results}
+
+    async def retry_dead_letters(self, dead_letters: List[Dict[str, Any]], include_dependent: bool = True,
+                                 passthrough: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Re-fetch only the partitions recorded in dead_letters, concurrently.
+
+        Same arguments, result and re-dead-lettering as
+        NHLExtractor.retry_dead_letters; result keys and records keep the
+        order of dead_letters.
+        """
+        async def retry(letter) -> List[Tuple[str, List[Dict[str, Any]]]]:
+            stream_name = letter['stream']
+            partition_value = letter.get('partition_value')
+
+            logger.info(f"Retrying {letter['endpoint']}...")
+            if stream_name.endswith(RAW_STREAM_SUFFIX):
+                stream = self._stream(stream_name[:-len(RAW_STREAM_SUFFIX)])
+                record = await stream.read_raw_partition(partition_value)
+                records = [record] if record is not None else []
+            elif partition_value is None:
+                records = [record async for record in self._stream(stream_name).read_records()]
+            else:
+                records = [record async for record in self._stream(stream_name).read_partition(partition_value)]
+
+            if not (include_dependent and records):
+                return [(stream_name, records)]
+
+            async def read_child(child, raw: bool) -> List[Dict[str, Any]]:
+                read = child.read_raw_records if raw else child.read_records
+                return [record async for record in read(parent_records=records)]
+
+            dependents = self._retry_dependents(stream_name, passthrough)
+            children = await asyncio.gather(*[read_child(child, raw) for _, child, raw in dependents])
+            return [(stream_name, records)] + [(key, child_records)
+                                               for (key, _, _), child_records in zip(dependents, children)]
+
+        results = {}
+        retried = await asyncio.gather(*[retry(letter) for letter in self._unique_dead_letters(dead_letters)])
+        for streams in retried:
+            for stream_name, records in streams:
+                results.setdefault(stream_name, []).extend(records)
+        return results
@@ -0,0 +1,321 @@
+"""
+NHL Live Game Poller
+
+Long-running game-night mode: polls `score/now`, fetches play-by-play only for
+games in progress, and writes just the events newer than the last one seen
+per game as small Parquet micro-batches for the loader.
+
+Each batch lands in its own directory (output_dir/<UTC timestamp>/play_by_play.parquet)
+in the flattened, upper-cased column layout of the warehouse play_by_play
+table, so any batch - or all of them, with one COPY - can be loaded as-is:
+
+    python parquet_to_snowflake.py --input-dir ./data_live/20251107T013015_482113
+    python parquet_to_snowflake.py --input-dir './data_live/2*'
+
+Events are emitted once, by sortOrder. Later in-game corrections to an
+already-emitted event are picked up by the regular nightly nhl_to_parquet.py
+run; stg_nhl__play_by_play keeps the latest _loaded_at per event.
+
+Usage:
+    python nhl_live_poller.py --output-dir ./data_live
+    python nhl_live_poller.py --output-dir ./data_live --until-final
+"""
+
+import argparse
+import json
+import os
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from nhl_extractor import NHLAPIClient
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# gameState values from the score endpoints
+LIVE_STATES = {'LIVE', 'CRIT'}
+PREGAME_STATES = {'PRE'}
+FINAL_STATES = {'OFF', 'FINAL'}
+
+STATE_FILE = '_poller_state.json'
+
+
+def flatten_record(record: Dict[str, Any], codec, prefix: str = '') -> Dict[str, Any]:
+    """
+    Flatten nested dicts into upper-cased underscore-joined columns.
+
+    Matches the warehouse layout (details.xCoord -> DETAILS_XCOORD); lists are
+    kept as JSON strings like nhl_to_parquet.py does.
+    """
+    flat = {}
+    for key, value in record.items():
+        column = f"{prefix}{key}".upper()
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, codec, prefix=f"{column}_"))
+        elif isinstance(value, list):
+            flat[column] = codec.dumps(value)
+        else:
+            flat[column] = value
+    return flat
+
+
+def event_position(play: Dict[str, Any]) -> int:
+    """Ordering key for a play: sortOrder, falling back to eventId."""
+    position = play.get('sortOrder')
+    if position is None:
+        position = play.get('eventId')
+    return position if position is not None else -1
+
+
+class LivePoller:
+    """Tracks live games and emits play-by-play deltas."""
+
+    def __init__(
+        self,
+        client: NHLAPIClient,
+        output_dir: str,
+        crit_interval: float = 10,
+        live_interval: float = 20,
+        pregame_interval: float = 60,
+        idle_interval: float = 300,
+    ):
+        """
+        Initialize live poller.
+
+        Args:
+            client: NHL API client
+            output_dir: Directory for micro-batch subdirectories and poller state
+            crit_interval: Poll interval while any game is in a critical (late, close) state
+            live_interval: Poll interval while any game is live
+            pregame_interval: Poll interval while a game is in warmups
+            idle_interval: Maximum poll interval when nothing is live
+        """
+        self.client = client
+        self.output_dir = output_dir
+        self.crit_interval = crit_interval
+        self.live_interval = live_interval
+        self.pregame_interval = pregame_interval
+        self.idle_interval = idle_interval
+        self.state_path = os.path.join(output_dir, STATE_FILE)
+        self.games = self._load_state()
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Load last-seen positions so a restarted poller doesn't re-emit events."""
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path) as f:
+            return json.load(f).get('games', {})
+
+    def _save_state(self):
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'games': self.games}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def poll_interval(self, games: List[Dict[str, Any]]) -> float:
+        """Pick the next interval from the states of today's games."""
+        states = {game.get('gameState') for game in games}
+        if 'CRIT' in states:
+            return self.crit_interval
+        if states & LIVE_STATES:
+            return self.live_interval
+        if states & PREGAME_STATES:
+            return self.pregame_interval
+
+        # Nothing live: wake up shortly before the next scheduled start
+        now = datetime.now(timezone.utc)
+        upcoming = []
+        for game in games:
+            start = game.get('startTimeUTC')
+            if start and game.get('gameState') not in FINAL_STATES:
+                seconds = (datetime.fromisoformat(start.replace('Z', '+00:00')) - now).total_seconds()
+                upcoming.append(seconds - self.pregame_interval)
+        if upcoming:
+            return min(self.idle_interval, max(self.pregame_interval, min(upcoming)))
+        return self.idle_interval
+
+    def _fetch_new_events(self, game_id: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch a game's play-by-play and keep only events past the last seen position.
+
+        Returns:
+            The new events, or None if the play-by-play could not be fetched
+        """
+        key = str(game_id)
+        last_seen = self.games.get(key, {}).get('last_position', -1)
+
+        data = self.client.get(f"gamecenter/{game_id}/play-by-play")
+        if not data:
+            return None
+
+        plays = [play for play in data.get('plays') or [] if event_position(play) > last_seen]
+        if plays:
+            self.games.setdefault(key, {})['last_position'] = max(event_position(p) for p in plays)
+        return plays
+
+    def poll_once(self) -> Dict[str, Any]:
+        """
+        Run one polling cycle.
+
+        Returns:
+            dict with today's games, the number of new events written, and
+            the interval to wait before the next cycle
+        """
+        data = self.client.get('score/now') or {}
+        games = data.get('games') or []
+
+        rows = []
+        swept = []
+        for game in games:
+            game_id = game.get('id')
+            game_state = game.get('gameState')
+            tracked = self.games.get(str(game_id))
+            # One last sweep to catch events logged after our previous poll
+            final_sweep = game_state in FINAL_STATES and tracked and not tracked.get('final')
+
+            if game_state in LIVE_STATES:
+                self.games.setdefault(str(game_id), {})['final'] = False
+            elif not final_sweep:
+                continue
+
+            plays = self._fetch_new_events(game_id)
+            if plays is None:
+                # A failed final sweep is retried next cycle
+                continue
+            if final_sweep:
+                swept.append(tracked)
+
+            for play in plays:
+                row = flatten_record(play, self.client.codec)
+                row['GAME_ID'] = game_id
+                rows.append(row)
+
+        if rows:
+            self._write_batch(rows)
+        # Only once its last events are written is a game done
+        for tracked in swept:
+            tracked['final'] = True
+
+        # Forget finished games that have rolled off the scoreboard
+        listed = {str(game.get('id')) for game in games}
+        self.games = {
+            key: value for key, value in self.games.items()
+            if key in listed or not value.get('final')
+        }
+        self._save_state()
+
+        return {
+            'games': games,
+            'new_events': len(rows),
+            'interval': self.poll_interval(games),
+        }
+
+    def _write_batch(self, rows: List[Dict[str, Any]]):
+        """Write one micro-batch in the flattened play_by_play layout."""
+        now = datetime.now(timezone.utc)
+        batch_dir = os.path.join(self.output_dir, now.strftime('%Y%m%dT%H%M%S_%f'))
+        os.makedirs(batch_dir, exist_ok=True)
+
+        df = pd.DataFrame(rows)
+        # Both stamps in UTC: int__game_loads compares them across loaders.
+        # _ETL_LOADED_AT stays tz-naive to keep the column's parquet type.
+        df['_ETL_LOADED_AT'] = now.replace(tzinfo=None)
+        df['_LOADED_AT'] = now.isoformat()
+
+        output_file = os.path.join(batch_dir, 'play_by_play.parquet')
+        df.to_parquet(output_file, index=False, engine='pyarrow')
+        logger.info(f"✓ Saved {len(rows)} new events to {output_file}")
+
+    def run(self, until_final: bool = False, max_polls: Optional[int] = None):
+        """
+        Poll until interrupted.
+
+        Args:
+            until_final: Stop once every game on today's scoreboard is final
+            max_polls: Stop after this many cycles (for testing)
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            result = self.poll_once()
+            polls += 1
+
+            states = [game.get('gameState') for game in result['games']]
+            live = sum(state in LIVE_STATES for state in states)
+            logger.info(
+                f"{len(states)} games on scoreboard, {live} live, "
+                f"{result['new_events']} new events; next poll in {result['interval']:.0f}s"
+            )
+
+            if until_final and states and all(state in FINAL_STATES for state in states) \
+                    and all(game.get('final') for game in self.games.values()):
+                logger.info("All games final, stopping.")
+                break
+
+            time.sleep(result['interval'])
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Poll live NHL games and write play-by-play deltas to Parquet'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default='./data_live',
+        help='Directory for micro-batches and poller state (default: ./data_live)'
+    )
+    parser.add_argument(
+        '--live-interval',
+        type=float,
+        default=20,
+        help='Seconds between polls while games are live (default: 20)'
+    )
+    parser.add_argument(
+        '--idle-interval',
+        type=float,
+        default=300,
+        help='Maximum seconds between polls when nothing is live (default: 300)'
+    )
+    parser.add_argument(
+        '--until-final',
+        action='store_true',
+        help="Exit once all of today's games are final"
+    )
+    parser.add_argument(
+        '--request-delay',
+        type=float,
+        default=0.5,
+        help='Delay between API requests in seconds (default: 0.5)'
+    )
+
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    client = NHLAPIClient(request_delay=args.request_delay)
+    poller = LivePoller(
+        client,
+        output_dir=args.output_dir,
+        crit_interval=min(10, args.live_interval),
+        live_interval=args.live_interval,
+        idle_interval=args.idle_interval,
+    )
+
+    try:
+        poller.run(until_final=args.until_final)
+    except KeyboardInterrupt:
+        logger.info("Interrupted, state saved.")
+    except Exception as e:
+        logger.error(f"Error during polling: {e}", exc_info=True)
+        raise
+
+
+if __name__ == '__main__':
+    main()
@@ -3,17 +3,28 @@ NHL Data Extractor to Parquet Files
 
 Extracts data from NHL API and saves to Parquet files for Snowflake loading.
 
+Partitions whose requests still fail after all retries (a date, game or team)
+are listed in <output-dir>/_dead_letters.json. --retry-failed re-fetches just
+those partitions and merges them into the existing Parquet files.
+
 Usage:
     python nhl_to_parquet.py --start-date 2025-11-07 --end-date 2025-11-07 --output-dir ./data
+    python nhl_to_parquet.py --output-dir ./data --retry-failed
 """
 
 import argparse
+import asyncio
+import json
 import os
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
-from nhl_extractor import NHLExtractor
+from nhl_extractor import NHLExtractor, RAW_STREAM_SUFFIX
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +32,209 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DEAD_LETTER_FILE = '_dead_letters.json'
+
+
+def etl_timestamp() -> datetime:
+    """
+    Load time for the _etl_loaded_at column: UTC, like _loaded_at.
+
+    Kept tz-naive so the column's parquet type doesn't change. int__game_loads
+    compares it with _loaded_at, so both must be on the same clock.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def records_to_frame(records: List[Dict[str, Any]], codec) -> pd.DataFrame:
+    """
+    Build the DataFrame written for a (non-raw) stream.
+
+    Nested dict/list columns are encoded as JSON strings with the given codec
+    (Snowflake can parse JSON when loading) and an ETL timestamp is added.
+    """
+    df = pd.DataFrame(records)
+
+    # Convert all dict/list columns to JSON strings for Parquet compatibility
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            # Check if any value in column is dict or list
+            sample = df[col].dropna().head(1)
+            if len(sample) > 0 and isinstance(sample.iloc[0], (dict, list)):
+                df[col] = df[col].apply(lambda x: codec.dumps(x) if x is not None else None)
+
+    # Add ETL timestamp
+    df['_etl_loaded_at'] = etl_timestamp()
+    return df
+
+
+def raw_records_to_table(records: List[Dict[str, Any]]) -> pa.Table:
+    """Build the Arrow table written for passthrough records (see write_raw_parquet)."""
+    return pa.table({
+        'game_id': pa.array([r['game_id'] for r in records], type=pa.int64()),
+        'season': pa.array([r['season'] for r in records], type=pa.int64()),
+        'game_state': pa.array([r['game_state'] for r in records], type=pa.string()),
+        'payload': pa.array([r['payload'] for r in records], type=pa.large_string()),
+        # ISO text, cast on load, so the COPY transform doesn't depend on parquet timestamp units
+        '_etl_loaded_at': pa.array([etl_timestamp().isoformat()] * len(records), type=pa.string()),
+    })
+
+
+def write_raw_parquet(records: List[Dict[str, Any]], output_file):
+    """
+    Write passthrough records (raw JSON payloads plus game keys) to Parquet.
+
+    The payload bytes go straight into a zstd-compressed string column without
+    being parsed or re-serialized; the loader binds it to a VARIANT column.
+    output_file may be a path or a writable binary file object.
+    """
+    pq.write_table(raw_records_to_table(records), output_file, compression='zstd')
+
+
+def write_dead_letters(output_dir: str, dead_letters: List[Dict[str, Any]], run: Dict[str, Any]):
+    """
+    Record failed partitions for --retry-failed, or clear the file if none failed.
+
+    Args:
+        output_dir: Directory holding the run's Parquet files
+        dead_letters: Failed partitions (NHLExtractor.dead_letters)
+        run: Options of the run (dates, include_dependent, passthrough), reused on retry
+    """
+    dead_letter_path = os.path.join(output_dir, DEAD_LETTER_FILE)
+    if not dead_letters:
+        if os.path.exists(dead_letter_path):
+            os.remove(dead_letter_path)
+        return
+
+    tmp_path = f"{dead_letter_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'run': run, 'failed': dead_letters}, f, indent=2, default=str)
+    os.replace(tmp_path, dead_letter_path)
+
+    logger.warning(f"{len(dead_letters)} partition(s) failed after all retries, listed in {dead_letter_path}")
+    for letter in dead_letters:
+        logger.warning(f"  {letter['stream']}: {letter['endpoint']} ({letter['error']})")
+    logger.warning(f"Recover them with: python nhl_to_parquet.py --output-dir {output_dir} --retry-failed")
+
+
+def merge_into_parquet(stream_name: str, records: List[Dict[str, Any]], output_dir: str,
+                       codec, partition_field: Optional[str]) -> int:
+    """
+    Merge retried records into a stream's existing Parquet file.
+
+    Rows of the existing file in the retried partitions are replaced; a
+    stream without partitions (a simple stream) is replaced entirely.
+
+    Returns:
+        Row count of the merged file
+    """
+    output_file = os.path.join(output_dir, f"{stream_name}.parquet")
+    raw = stream_name.endswith(RAW_STREAM_SUFFIX)
+    if raw:
+        table = raw_records_to_table(records)
+    else:
+        table = pa.Table.from_pandas(records_to_frame(records, codec), preserve_index=False)
+
+    if partition_field and os.path.exists(output_file):
+        existing = pq.read_table(output_file)
+        if partition_field in existing.column_names:
+            column = existing[partition_field]
+            retried = pc.unique(table[partition_field]).cast(column.type)
+            existing = existing.filter(pc.invert(pc.is_in(column, value_set=retried)))
+        table = pa.concat_tables([existing, table], promote_options='permissive')
+
+    tmp_file = f"{output_file}.tmp"
+    pq.write_table(table, tmp_file, compression='zstd' if raw else 'snappy')
+    os.replace(tmp_file, output_file)
+    return table.num_rows
+
+
+def retry_failed(
+    output_dir: str = "./data",
+    request_delay: float = 1.0,
+    json_codec: str = 'auto',
+    pool_size: int = 10,
+    http2: bool = False,
+    concurrent: bool = False,
+):
+    """
+    Re-fetch the partitions listed in <output_dir>/_dead_letters.json.
+
+    Recovered records (plus dependent streams of recovered parent partitions)
+    are merged into the existing Parquet files, and the dead-letter file is
+    rewritten with whatever still fails.
+
+    Args:
+        output_dir: Directory of the run being repaired
+        request_delay: Delay between API requests in seconds
+        json_codec: JSON backend for decoding responses and encoding nested columns
+        pool_size: Maximum keep-alive connections held open to the API
+        http2: Use an httpx HTTP/2 client instead of requests
+        concurrent: Retry the partitions concurrently with AsyncNHLExtractor
+            (requires httpx); concurrency is capped by pool_size
+    """
+    dead_letter_path = os.path.join(output_dir, DEAD_LETTER_FILE)
+    if not os.path.exists(dead_letter_path):
+        logger.info(f"No {DEAD_LETTER_FILE} in {output_dir}, nothing to retry")
+        return
+
+    with open(dead_letter_path) as f:
+        dead_letter_file = json.load(f)
+    run = dead_letter_file['run']
+    failed = dead_letter_file['failed']
+
+    logger.info("=" * 70)
+    logger.info("Retrying Failed Partitions")
+    logger.info("=" * 70)
+    logger.info(f"Dead letters: {len(failed)} from run {run['start_date']} to {run['end_date']}")
+    logger.info(f"Output directory: {output_dir}")
+    logger.info("=" * 70)
+
+    extractor_kwargs = dict(
+        start_date=run['start_date'],
+        end_date=run['end_date'],
+        max_retries=5,
+        retry_delay=2,
+        request_delay=request_delay,
+        json_codec=json_codec,
+        pool_size=pool_size,
+        http2=http2
+    )
+    retry_kwargs = dict(
+        include_dependent=run.get('include_dependent', True),
+        passthrough=run.get('passthrough', False),
+    )
+
+    if concurrent:
+        # Imported lazily so the sequential path doesn't need httpx
+        from nhl_extractor_async import AsyncNHLExtractor
+
+        async def retry_async():
+            async with AsyncNHLExtractor(**extractor_kwargs) as extractor:
+                return extractor, await extractor.retry_dead_letters(failed, **retry_kwargs)
+
+        extractor, recovered = asyncio.run(retry_async())
+    else:
+        extractor = NHLExtractor(**extractor_kwargs)
+        try:
+            recovered = extractor.retry_dead_letters(failed, **retry_kwargs)
+        finally:
+            extractor.client.close()
+    codec = extractor.client.codec
+
+    for stream_name, records in recovered.items():
+        if not records:
+            continue
+        rows = merge_into_parquet(
+            stream_name, records, output_dir, codec, extractor.partition_field(stream_name)
+        )
+        logger.info(f"✓ Merged {len(records)} recovered records into {stream_name}.parquet ({rows} rows)")
+
+    write_dead_letters(output_dir, extractor.dead_letters, run)
+
+    logger.info("\n" + "=" * 70)
+    logger.info(f"Retry complete: {len(failed) - len(extractor.dead_letters)} of {len(failed)} partition(s) recovered")
+    logger.info("=" * 70)
+
 
 def extract_to_parquet(
     start_date: str,
@@ -28,6 +242,11 @@ def extract_to_parquet(
     output_dir: str = "./data",
     include_dependent: bool = True,
     request_delay: float = 1.0,
+    json_codec: str = 'auto',
+    passthrough: bool = False,
+    pool_size: int = 10,
+    http2: bool = False,
+    concurrent: bool = False,
 ):
     """
     Extract NHL data and save to Parquet files.
@@ -38,6 +257,14 @@ def extract_to_parquet(
         output_dir: Directory to save Parquet files
         include_dependent: Whether to include dependent streams
         request_delay: Delay between API requests in seconds
+        json_codec: JSON backend for decoding responses and encoding nested
+            columns ('auto', 'orjson', 'msgspec', 'json')
+        passthrough: Store game_boxscore, game_summaries and play_by_play as raw
+            JSON payloads in '<stream>_raw.parquet' instead of flattened columns
+        pool_size: Maximum keep-alive connections held open to the API
+        http2: Use an httpx HTTP/2 client instead of requests
+        concurrent: Run all streams concurrently with AsyncNHLExtractor
+            (requires httpx); concurrency is capped by pool_size
     """
     logger.info("=" * 70)
     logger.info("NHL Data Extraction to Parquet Files")
@@ -45,22 +272,45 @@ def extract_to_parquet(
     logger.info(f"Date range: {start_date} to {end_date}")
     logger.info(f"Output directory: {output_dir}")
     logger.info(f"Request delay: {request_delay}s (to avoid rate limiting)")
+    logger.info(f"Passthrough game streams: {passthrough}")
     logger.info("=" * 70)
 
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
     # Initialize extractor
-    extractor = NHLExtractor(
+    extractor_kwargs = dict(
         start_date=start_date,
         end_date=end_date,
         max_retries=5,
         retry_delay=2,
-        request_delay=request_delay
+        request_delay=request_delay,
+        json_codec=json_codec,
+        pool_size=pool_size,
+        http2=http2
     )
 
-    # Extract all streams
-    all_data = extractor.extract_all(include_dependent=include_dependent)
+    if concurrent:
+        # Imported lazily so the sequential path doesn't need httpx
+        from nhl_extractor_async import AsyncNHLExtractor
+
+        async def extract_all_async():
+            async with AsyncNHLExtractor(**extractor_kwargs) as extractor:
+                all_data = await extractor.extract_all(
+                    include_dependent=include_dependent, passthrough=passthrough
+                )
+                return extractor.client.codec, all_data, extractor.dead_letters
+
+        codec, all_data, dead_letters = asyncio.run(extract_all_async())
+        logger.info(f"JSON codec: {codec.name}")
+    else:
+        extractor = NHLExtractor(**extractor_kwargs)
+        codec = extractor.client.codec
+        logger.info(f"JSON codec: {codec.name}")
+
+        # Extract all streams
+        all_data = extractor.extract_all(include_dependent=include_dependent, passthrough=passthrough)
+        dead_letters = extractor.dead_letters
 
     # Save each stream to Parquet
     logger.info("\n" + "=" * 70)
@@ -72,21 +322,13 @@ def extract_to_parquet(
             logger.warning(f"No records for {stream_name}, skipping...")
             continue
 
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
-
-        # Convert all dict/list columns to JSON strings for Parquet compatibility
-        # Snowflake can parse JSON when loading
-        import json
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                # Check if any value in column is dict or list
-                sample = df[col].dropna().head(1)
-                if len(sample) > 0 and isinstance(sample.iloc[0], (dict, list)):
-                    df[col] = df[col].apply(lambda x: json.dumps(x) if x is not None else None)
+        if stream_name.endswith(RAW_STREAM_SUFFIX):
+            output_file = os.path.join(output_dir, f"{stream_name}.parquet")
+            write_raw_parquet(records, output_file)
+            logger.info(f"✓ Saved {len(records)} raw records to {output_file}")
+            continue
 
-        # Add ETL timestamp
-        df['_etl_loaded_at'] = datetime.now()
+        df = records_to_frame(records, codec)
 
         # Save to Parquet
         output_file = os.path.join(output_dir, f"{stream_name}.parquet")
@@ -94,6 +336,13 @@ def extract_to_parquet(
 
         logger.info(f"✓ Saved {len(records)} records to {output_file}")
 
+    write_dead_letters(output_dir, dead_letters, {
+        'start_date': start_date,
+        'end_date': end_date,
+        'include_dependent': include_dependent,
+        'passthrough': passthrough,
+    })
+
     logger.info("\n" + "=" * 70)
     logger.info("Extraction complete!")
     logger.info("=" * 70)
@@ -137,16 +386,65 @@ def main():
         default=1.0,
         help='Delay between API requests in seconds (default: 1.0)'
     )
+    parser.add_argument(
+        '--json-codec',
+        choices=['auto', 'orjson', 'msgspec', 'json'],
+        default='auto',
+        help='JSON backend for API decoding and nested column encoding (default: auto, fastest installed)'
+    )
+    parser.add_argument(
+        '--passthrough',
+        action='store_true',
+        help='Store boxscore/summary/play-by-play responses as raw JSON payloads (<stream>_raw.parquet)'
+    )
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=10,
+        help='Maximum keep-alive connections to the NHL API (default: 10)'
+    )
+    parser.add_argument(
+        '--http2',
+        action='store_true',
+        help='Use an HTTP/2 client (requires httpx[http2])'
+    )
+    parser.add_argument(
+        '--concurrent',
+        action='store_true',
+        help='Extract all streams (or with --retry-failed, the failed partitions) concurrently '
+             'in one asyncio event loop (requires httpx)'
+    )
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help=f'Re-fetch only the partitions in <output-dir>/{DEAD_LETTER_FILE} and merge them into the existing files'
+    )
 
     args = parser.parse_args()
 
     try:
+        if args.retry_failed:
+            retry_failed(
+                output_dir=args.output_dir,
+                request_delay=args.request_delay,
+                json_codec=args.json_codec,
+                pool_size=args.pool_size,
+                http2=args.http2,
+                concurrent=args.concurrent,
+            )
+            return
+
         extract_to_parquet(
             start_date=args.start_date,
             end_date=args.end_date,
             output_dir=args.output_dir,
             include_dependent=not args.no_dependent,
             request_delay=args.request_delay,
+            json_codec=args.json_codec,
+            passthrough=args.passthrough,
+            pool_size=args.pool_size,
+            http2=args.http2,
+            concurrent=args.concurrent,
         )
     except Exception as e:
         logger.error(f"Error during extraction: {e}", exc_info=True)
@@ -0,0 +1,399 @@
+"""
+NHL API to Snowflake Streaming Load
+
+End-to-end mode for the daily incremental run: streams are extracted batch by
+batch (NHLExtractor.iter_batches), each batch is serialized to a zstd parquet
+chunk in memory, PUT into the stage straight from memory and COPYed by a
+loader thread while extraction carries on. No local parquet files are
+written, and wall time is roughly max(extract, load) instead of their sum.
+
+Tables are loaded exactly as parquet_to_snowflake.py would load the same
+data: full-replace tables are recreated by one COPY of all their chunks once
+their stream is complete, other tables are appended with schema-drift
+handling every few chunks (see StreamingLoader).
+
+Usage:
+    python nhl_to_snowflake.py --start-date 2025-11-07 --end-date 2025-11-07
+    python nhl_to_snowflake.py --passthrough --batch-size 200
+"""
+
+import argparse
+import io
+import logging
+import queue
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import snowflake.connector
+
+from nhl_extractor import NHLExtractor, RAW_STREAM_SUFFIX
+from nhl_to_parquet import records_to_frame, write_raw_parquet
+from parquet_to_snowflake import (
+    FULL_REPLACE_TABLES,
+    create_stage,
+    get_snowflake_config,
+    load_staged_files,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+STAGE_NAME = "nhl_parquet_stage"
+
+
+def batch_to_parquet(stream_name: str, records: List[Dict[str, Any]], codec) -> io.BytesIO:
+    """Serialize one batch to an in-memory parquet chunk, in nhl_to_parquet.py's layout."""
+    buffer = io.BytesIO()
+    if stream_name.endswith(RAW_STREAM_SUFFIX):
+        write_raw_parquet(records, buffer)
+    else:
+        records_to_frame(records, codec).to_parquet(
+            buffer, index=False, engine='pyarrow', compression='zstd'
+        )
+    buffer.seek(0)
+    return buffer
+
+
+class StreamingLoader(threading.Thread):
+    """
+    Background thread that uploads parquet chunks as they are queued and
+    COPYs them into their tables.
+
+    Chunks are PUT as soon as they arrive but loaded per table: when the
+    extractor moves on to the next stream, or every chunks_per_copy chunks for
+    append tables. So the schema-drift/INFER_SCHEMA cycle runs once per COPY,
+    not once per chunk. A full-replace table is replaced by a single COPY of
+    all its chunks, and readers never see it half-filled.
+
+    A stream counts as complete once the next stream's first chunk arrives,
+    or at finish(complete=True). finish(complete=False) (extraction failed)
+    drops the unloaded chunks of the stream that was still in progress.
+    """
+
+    def __init__(self, drop_tables: bool = False, max_pending: int = 4, chunks_per_copy: int = 8):
+        """
+        Initialize streaming loader.
+
+        Args:
+            drop_tables: Whether every table is replaced by its first COPY
+                (as parquet_to_snowflake.py --drop-tables)
+            max_pending: Chunks held in memory before extraction waits on the loader
+            chunks_per_copy: Staged chunks of an append table loaded per COPY
+        """
+        super().__init__(name='snowflake-loader', daemon=True)
+        self.config = get_snowflake_config()
+        self.drop_tables = drop_tables
+        self.chunks_per_copy = chunks_per_copy
+        self.prefix = f"stream/{datetime.now().strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.chunks = queue.Queue(maxsize=max_pending)
+        # Chunks/rows uploaded but not yet COPYed, per table
+        self.staged: Dict[str, int] = {}
+        self.staged_rows: Dict[str, int] = {}
+        # COPYs run, chunks and rows loaded, per table
+        self.copies: Dict[str, int] = {}
+        self.loaded: Dict[str, int] = {}
+        self.rows: Dict[str, int] = {}
+        self.uploaded = 0
+        # Chunks dropped from the stream in progress when extraction failed
+        self.discarded: Dict[str, int] = {}
+        self.complete = True
+        self.error: Optional[BaseException] = None
+
+    def _put(self, item):
+        """Queue an item, giving up if the loader thread has failed or exited."""
+        while True:
+            if self.error is not None:
+                raise RuntimeError(f"Loader failed: {self.error}") from self.error
+            if not self.is_alive():
+                raise RuntimeError("Loader thread is not running")
+            try:
+                self.chunks.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def submit(self, table_name: str, buffer: io.BytesIO, row_count: int):
+        """Queue a chunk for loading; blocks while max_pending chunks are waiting."""
+        self._put((table_name, buffer, row_count))
+
+    def finish(self, complete: bool = True):
+        """
+        Load what is staged and stop; re-raises a loader failure.
+
+        Args:
+            complete: Whether the last stream was extracted in full. If not,
+                its staged chunks are removed instead of loaded.
+        """
+        # Read by the loader thread after it takes the sentinel off the queue
+        self.complete = complete
+        if self.error is None and self.is_alive():
+            self._put(None)
+        self.join()
+        if self.error is not None:
+            raise RuntimeError(f"Loader failed: {self.error}") from self.error
+
+    def run(self):
+        conn = None
+        try:
+            conn = snowflake.connector.connect(**self.config)
+            cursor = conn.cursor()
+            create_stage(cursor, STAGE_NAME)
+
+            while True:
+                item = self.chunks.get()
+                if item is None:
+                    break
+                table_name = item[0]
+
+                # Streams arrive one after another: a new table means the
+                # previous ones are complete
+                for finished in [name for name in self.staged if name != table_name]:
+                    self._copy_staged(cursor, finished)
+
+                self._stage_chunk(cursor, *item)
+                if not self._is_replaced(table_name) and self.staged[table_name] >= self.chunks_per_copy:
+                    self._copy_staged(cursor, table_name)
+
+            for table_name in list(self.staged):
+                if self.complete:
+                    self._copy_staged(cursor, table_name)
+                else:
+                    self._discard_staged(cursor, table_name)
+        except BaseException as e:
+            self.error = e
+            logger.error(f"Loader stopped: {e}", exc_info=True)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _is_replaced(self, table_name: str) -> bool:
+        """Whether the table's first COPY replaces it."""
+        return self.drop_tables or table_name in FULL_REPLACE_TABLES
+
+    def _location(self, table_name: str) -> str:
+        """Stage prefix for the table's chunks awaiting the next COPY."""
+        return f"{self.prefix}/{table_name}/{self.copies.get(table_name, 0):04d}/"
+
+    def _stage_chunk(self, cursor, table_name: str, buffer: io.BytesIO, row_count: int):
+        chunk_name = f"{table_name}_{self.uploaded:05d}.parquet"
+        location = self._location(table_name)
+
+        logger.info(f"Uploading {location}{chunk_name} ({row_count} records) to stage...")
+        cursor.execute(
+            f"PUT file://{chunk_name} @{STAGE_NAME}/{location} AUTO_COMPRESS=FALSE OVERWRITE=TRUE",
+            file_stream=buffer
+        )
+        self.uploaded += 1
+        self.staged[table_name] = self.staged.get(table_name, 0) + 1
+        self.staged_rows[table_name] = self.staged_rows.get(table_name, 0) + row_count
+
+    def _copy_staged(self, cursor, table_name: str):
+        """COPY every staged chunk of a table in one go, then clear them from the stage."""
+        location = self._location(table_name)
+        copies = self.copies.get(table_name, 0)
+        chunks = self.staged.pop(table_name)
+        rows = self.staged_rows.pop(table_name)
+
+        # Later COPYs of a replaced table (drop_tables only) append to the first
+        replace = copies == 0 and self._is_replaced(table_name)
+        load_staged_files(cursor, STAGE_NAME, location, table_name, self.config['schema'], replace=replace)
+        cursor.execute(f"REMOVE @{STAGE_NAME}/{location}")
+
+        self.copies[table_name] = copies + 1
+        self.loaded[table_name] = self.loaded.get(table_name, 0) + chunks
+        self.rows[table_name] = self.rows.get(table_name, 0) + rows
+        logger.info(f"✓ Loaded {chunks} chunk(s), {rows} records into {table_name}")
+
+    def _discard_staged(self, cursor, table_name: str):
+        """Remove an incomplete stream's staged chunks without loading them."""
+        location = self._location(table_name)
+        chunks = self.staged.pop(table_name)
+        rows = self.staged_rows.pop(table_name)
+
+        cursor.execute(f"REMOVE @{STAGE_NAME}/{location}")
+        self.discarded[table_name] = chunks
+        logger.warning(
+            f"Not loading {table_name}: its stream did not finish "
+            f"({chunks} staged chunk(s), {rows} records dropped)"
+        )
+
+
+def extract_to_snowflake(
+    start_date: str,
+    end_date: str,
+    include_dependent: bool = True,
+    request_delay: float = 1.0,
+    json_codec: str = 'auto',
+    passthrough: bool = False,
+    pool_size: int = 10,
+    http2: bool = False,
+    batch_size: int = 1000,
+    drop_tables: bool = False,
+):
+    """
+    Extract NHL data and load it into Snowflake without local parquet files.
+
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        include_dependent: Whether to include dependent streams
+        request_delay: Delay between API requests in seconds
+        json_codec: JSON backend for decoding responses and encoding nested columns
+        passthrough: Load game_boxscore, game_summaries and play_by_play as raw
+            JSON payloads into '<stream>_raw' tables
+        pool_size: Maximum keep-alive connections held open to the API
+        http2: Use an httpx HTTP/2 client instead of requests
+        batch_size: Maximum records per uploaded chunk
+        drop_tables: Force full replace for all tables
+    """
+    logger.info("=" * 70)
+    logger.info("NHL Data Streaming Load to Snowflake")
+    logger.info("=" * 70)
+    logger.info(f"Date range: {start_date} to {end_date}")
+    logger.info(f"Batch size: {batch_size} records")
+    logger.info(f"Passthrough game streams: {passthrough}")
+    logger.info("=" * 70)
+
+    extractor = NHLExtractor(
+        start_date=start_date,
+        end_date=end_date,
+        max_retries=5,
+        retry_delay=2,
+        request_delay=request_delay,
+        json_codec=json_codec,
+        pool_size=pool_size,
+        http2=http2
+    )
+    codec = extractor.client.codec
+    logger.info(f"JSON codec: {codec.name}")
+
+    loader = StreamingLoader(drop_tables=drop_tables)
+    loader.start()
+
+    try:
+        for stream_name, records in extractor.iter_batches(
+            include_dependent=include_dependent,
+            passthrough=passthrough,
+            batch_size=batch_size
+        ):
+            if not records:
+                logger.warning(f"No records for {stream_name}, skipping...")
+                continue
+            loader.submit(stream_name, batch_to_parquet(stream_name, records, codec), len(records))
+    except BaseException:
+        extractor.client.close()
+        # Load the streams that finished, drop the one cut short, and raise
+        # the original error
+        try:
+            loader.finish(complete=False)
+        except RuntimeError as e:
+            logger.error(f"{e}")
+        raise
+
+    extractor.client.close()
+    loader.finish()
+
+    logger.info("\n" + "=" * 70)
+    logger.info("Streaming load complete!")
+    logger.info("=" * 70)
+    for table_name, rows in loader.rows.items():
+        logger.info(
+            f"  {table_name}: {rows} records in {loader.loaded[table_name]} chunk(s), "
+            f"{loader.copies[table_name]} COPY(s)"
+        )
+    logger.info("=" * 70)
+
+    # No output directory to keep a dead-letter file in; rerun these ranges
+    for letter in extractor.dead_letters:
+        logger.warning(f"Not loaded, failed after all retries: {letter['stream']} {letter['endpoint']} ({letter['error']})")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Extract NHL data and stream it into Snowflake without local Parquet files'
+    )
+    parser.add_argument(
+        '--start-date',
+        type=str,
+        default=(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d'),
+        help='Start date in YYYY-MM-DD format (default: 7 days ago)'
+    )
+    parser.add_argument(
+        '--end-date',
+        type=str,
+        default=datetime.now().strftime('%Y-%m-%d'),
+        help='End date in YYYY-MM-DD format (default: today)'
+    )
+    parser.add_argument(
+        '--no-dependent',
+        action='store_true',
+        help='Skip dependent streams (faster for testing)'
+    )
+    parser.add_argument(
+        '--request-delay',
+        type=float,
+        default=1.0,
+        help='Delay between API requests in seconds (default: 1.0)'
+    )
+    parser.add_argument(
+        '--json-codec',
+        choices=['auto', 'orjson', 'msgspec', 'json'],
+        default='auto',
+        help='JSON backend for API decoding and nested column encoding (default: auto, fastest installed)'
+    )
+    parser.add_argument(
+        '--passthrough',
+        action='store_true',
+        help='Load boxscore/summary/play-by-play responses as raw JSON payloads (<stream>_raw tables)'
+    )
+    parser.add_argument(
+        '--pool-size',
+        type=int,
+        default=10,
+        help='Maximum keep-alive connections to the NHL API (default: 10)'
+    )
+    parser.add_argument(
+        '--http2',
+        action='store_true',
+        help='Use an HTTP/2 client (requires httpx[http2])'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=1000,
+        help='Maximum records per uploaded chunk (default: 1000)'
+    )
+    parser.add_argument(
+        '--drop-tables',
+        action='store_true',
+        help='Force full replace for ALL tables'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        extract_to_snowflake(
+            start_date=args.start_date,
+            end_date=args.end_date,
+            include_dependent=not args.no_dependent,
+            request_delay=args.request_delay,
+            json_codec=args.json_codec,
+            passthrough=args.passthrough,
+            pool_size=args.pool_size,
+            http2=args.http2,
+            batch_size=args.batch_size,
+            drop_tables=args.drop_tables,
+        )
+    except Exception as e:
+        logger.error(f"Error during streaming load: {e}", exc_info=True)
+        raise
+
+
+if __name__ == '__main__':
+    main()
@@ -7,22 +7,41 @@ Loading Strategy:
     - Full Replace (always): team_rosters, current_standings, current_teams, season_schedules
     - Incremental Append: games, daily_standings, game_boxscore, game_summaries,
                           play_by_play
+    - Raw passthrough (*_raw, from nhl_to_parquet.py --passthrough): appended into
+      a fixed-schema table with the JSON payload parsed once into a VARIANT column
+
+Each table's files are uploaded under their own stage prefix
+(@nhl_parquet_stage/<table>/) and loaded with a single COPY ... PATTERN, so
+several directories (seasons, live-poller batches) cost one COPY per table
+rather than one per file.
 
 Usage:
     # Normal incremental load (full replace for specified tables, append for others)
     python parquet_to_snowflake.py --input-dir ./data
 
+    # Several directories / globs in one load (quote globs)
+    python parquet_to_snowflake.py --input-dir ./data_backfill_s2324_flat ./data_backfill_s2425_flat
+    python parquet_to_snowflake.py --input-dir './data_live/*'
+
     # Force full replace for ALL tables
     python parquet_to_snowflake.py --input-dir ./data --drop-tables
+
+    # Run validate_parquet.py checks first; rejected files are not loaded
+    python parquet_to_snowflake.py --input-dir ./data --validate
 """
 
 import argparse
+import glob
 import os
 import logging
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, List
 import snowflake.connector
 from dotenv import load_dotenv
 
+from validate_parquet import validate_directory
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -46,7 +65,7 @@ def get_snowflake_config():
     }
 
 
-def get_parquet_columns(cursor, stage_name: str, file_name: str) -> dict:
+def get_parquet_columns(cursor, stage_name: str, location: str) -> dict:
     """
     Get column names and types from a staged parquet file using INFER_SCHEMA.
 
@@ -57,7 +76,7 @@ def get_parquet_columns(cursor, stage_name: str, file_name: str) -> dict:
         SELECT COLUMN_NAME, TYPE
         FROM TABLE(
             INFER_SCHEMA(
-                LOCATION => '@{stage_name}/{file_name}',
+                LOCATION => '@{stage_name}/{location}',
                 FILE_FORMAT => 'nhl_parquet_format'
             )
         )
@@ -106,26 +125,319 @@ def add_missing_columns(cursor, table_name: str, parquet_cols: dict, table_cols:
     return added
 
 
+RAW_TABLE_SUFFIX = '_raw'
+
+# COPY pattern for a stage location (a single file or a table prefix)
+PARQUET_PATTERN = '.*[.]parquet'
+
+
+def load_raw_table(cursor, stage_name: str, location: str, table_name: str, replace: bool):
+    """
+    Load a passthrough parquet file (game keys + raw JSON payload).
+
+    INFER_SCHEMA would type the payload as TEXT, so raw tables get an explicit
+    schema and the payload is parsed into VARIANT inside the COPY transform.
+
+    Args:
+        cursor: Snowflake cursor
+        stage_name: Stage holding the uploaded files
+        location: Staged file, or prefix of staged files, relative to the stage
+        table_name: Target table name
+        replace: Whether to recreate the table instead of appending
+    """
+    create = "CREATE OR REPLACE TABLE" if replace else "CREATE TABLE IF NOT EXISTS"
+    cursor.execute(f"""
+    {create} {table_name} (
+        GAME_ID NUMBER,
+        SEASON NUMBER,
+        GAME_STATE STRING,
+        PAYLOAD VARIANT,
+        _ETL_LOADED_AT TIMESTAMP_NTZ
+    )
+    """)
+
+    logger.info(f"Loading raw payloads into {table_name}...")
+    cursor.execute(f"""
+    COPY INTO {table_name} (GAME_ID, SEASON, GAME_STATE, PAYLOAD, _ETL_LOADED_AT)
+    FROM (
+        SELECT
+            $1:game_id::number,
+            $1:season::number,
+            $1:game_state::string,
+            PARSE_JSON($1:payload::string),
+            $1:_etl_loaded_at::timestamp_ntz
+        FROM @{stage_name}/{location}
+    )
+    FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
+    PATTERN = '{PARQUET_PATTERN}'
+    ON_ERROR = CONTINUE
+    """)
+
+
+# Tables rebuilt from scratch on every load; everything else is appended
+FULL_REPLACE_TABLES = {'team_rosters', 'current_standings', 'current_teams', 'season_schedules'}
+
+
+def create_stage(cursor, stage_name: str):
+    """Create the upload stage and the parquet file format if they don't exist."""
+    cursor.execute(f"CREATE STAGE IF NOT EXISTS {stage_name}")
+    cursor.execute("""
+    CREATE FILE FORMAT IF NOT EXISTS nhl_parquet_format
+    TYPE = PARQUET
+    """)
+
+
+def load_staged_files(cursor, stage_name: str, location: str, table_name: str,
+                      schema: str, replace: bool):
+    """
+    Load a staged parquet file, or every parquet file under a stage prefix,
+    into its table with one COPY.
+
+    Raw passthrough tables (*_raw) go through load_raw_table; other tables are
+    either recreated from the inferred schema of the files or appended to,
+    adding any new columns first.
+
+    Args:
+        cursor: Snowflake cursor
+        stage_name: Stage holding the uploaded files
+        location: Staged file, or prefix of staged files, relative to the stage
+        table_name: Target table name
+        schema: Target schema (for INFORMATION_SCHEMA lookups)
+        replace: Whether to recreate the table instead of appending
+    """
+    is_raw = table_name.endswith(RAW_TABLE_SUFFIX)
+
+    if is_raw:
+        logger.info(f"Mode: RAW PASSTHROUGH ({'REPLACE' if replace else 'APPEND'})")
+        load_raw_table(cursor, stage_name, location, table_name, replace=replace)
+
+    elif replace:
+        logger.info(f"Mode: FULL REPLACE")
+        # Full replace mode: drop and recreate table
+        logger.info(f"Creating/replacing table {table_name}...")
+
+        create_sql = f"""
+        CREATE OR REPLACE TABLE {table_name}
+        USING TEMPLATE (
+            SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
+            FROM TABLE(
+                INFER_SCHEMA(
+                    LOCATION => '@{stage_name}/{location}',
+                    FILE_FORMAT => 'nhl_parquet_format'
+                )
+            )
+        )
+        """
+        cursor.execute(create_sql)
+
+        # Load data using COPY INTO
+        logger.info(f"Loading data into {table_name}...")
+        copy_sql = f"""
+        COPY INTO {table_name}
+        FROM @{stage_name}/{location}
+        FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
+        PATTERN = '{PARQUET_PATTERN}'
+        MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+        ON_ERROR = CONTINUE
+        """
+        cursor.execute(copy_sql)
+
+    else:
+        logger.info(f"Mode: INCREMENTAL APPEND")
+        # Incremental mode: create table if not exists, then append
+        # Check if table exists
+        cursor.execute(f"""
+            SELECT COUNT(*)
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = '{schema.upper()}'
+            AND TABLE_NAME = '{table_name.upper()}'
+        """)
+        table_exists = cursor.fetchone()[0] > 0
+
+        if not table_exists:
+            # Create table for the first time
+            logger.info(f"Table doesn't exist. Creating {table_name}...")
+            create_sql = f"""
+            CREATE TABLE {table_name}
+            USING TEMPLATE (
+                SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
+                FROM TABLE(
+                    INFER_SCHEMA(
+                        LOCATION => '@{stage_name}/{location}',
+                        FILE_FORMAT => 'nhl_parquet_format'
+                    )
+                )
+            )
+            """
+            cursor.execute(create_sql)
+
+            # Load initial data
+            logger.info(f"Loading initial data into {table_name}...")
+            copy_sql = f"""
+            COPY INTO {table_name}
+            FROM @{stage_name}/{location}
+            FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
+            PATTERN = '{PARQUET_PATTERN}'
+            MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+            ON_ERROR = CONTINUE
+            """
+            cursor.execute(copy_sql)
+
+        else:
+            # Table exists - handle schema drift and do incremental load
+            logger.info(f"Table exists. Checking for schema changes...")
+
+            # Get columns from parquet file and existing table
+            parquet_cols = get_parquet_columns(cursor, stage_name, location)
+            table_cols = get_table_columns(cursor, schema, table_name)
+
+            logger.info(f"  Parquet has {len(parquet_cols)} columns, table has {len(table_cols)} columns")
+
+            # Add any new columns from parquet to the table
+            added_cols = add_missing_columns(cursor, table_name, parquet_cols, table_cols)
+            if added_cols:
+                logger.info(f"  Added {len(added_cols)} new column(s) to table")
+                # Refresh table columns after adding new ones
+                table_cols = get_table_columns(cursor, schema, table_name)
+
+            # Find columns that exist in BOTH parquet and table (for INSERT)
+            common_cols = set(parquet_cols.keys()) & set(table_cols.keys())
+            missing_in_parquet = set(table_cols.keys()) - set(parquet_cols.keys())
+
+            if missing_in_parquet:
+                logger.info(f"  Columns in table but not in parquet (will be NULL): {missing_in_parquet}")
+
+            # Create temp table from parquet schema
+            temp_table = f"{table_name}_temp"
+            create_temp_sql = f"""
+            CREATE OR REPLACE TABLE {temp_table}
+            USING TEMPLATE (
+                SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
+                FROM TABLE(
+                    INFER_SCHEMA(
+                        LOCATION => '@{stage_name}/{location}',
+                        FILE_FORMAT => 'nhl_parquet_format'
+                    )
+                )
+            )
+            """
+            cursor.execute(create_temp_sql)
+
+            # Load data into temp table
+            logger.info(f"Loading data into temp table...")
+            copy_temp_sql = f"""
+            COPY INTO {temp_table}
+            FROM @{stage_name}/{location}
+            FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
+            PATTERN = '{PARQUET_PATTERN}'
+            MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+            ON_ERROR = CONTINUE
+            """
+            cursor.execute(copy_temp_sql)
+
+            # Get count of new records
+            cursor.execute(f"SELECT COUNT(*) FROM {temp_table}")
+            new_records = cursor.fetchone()[0]
+
+            # Build column list for INSERT (only columns that exist in both)
+            col_list = ', '.join(f'"{col}"' for col in sorted(common_cols))
+
+            # Append from temp table to main table using explicit column list
+            logger.info(f"Appending {new_records} new records to {table_name} ({len(common_cols)} columns)...")
+            cursor.execute(f"INSERT INTO {table_name} ({col_list}) SELECT {col_list} FROM {temp_table}")
+
+            # Drop temp table
+            cursor.execute(f"DROP TABLE {temp_table}")
+
+
+def expand_input_dirs(input_dirs: List[str]) -> List[str]:
+    """
+    Expand directories and glob patterns into the directories they name.
+
+    Files matched by a pattern (e.g. _poller_state.json under
+    './data_live/*') are skipped.
+
+    Args:
+        input_dirs: Directories or glob patterns matching directories
+
+    Returns:
+        Matching directories, in order
+    """
+    dirs = []
+    for pattern in input_dirs:
+        for input_dir in sorted(glob.glob(pattern)) or [pattern]:
+            if os.path.isdir(input_dir):
+                dirs.append(input_dir)
+            elif not os.path.exists(input_dir):
+                logger.warning(f"Input directory {input_dir} not found, skipping...")
+    return dirs
+
+
+def collect_parquet_files(input_dirs: List[str]) -> Dict[str, List[Path]]:
+    """
+    Find the parquet files of one or more input directories, grouped by table.
+
+    Args:
+        input_dirs: Directories or glob patterns matching directories
+
+    Returns:
+        dict mapping table name (file stem) -> files
+    """
+    files = defaultdict(list)
+    for input_dir in expand_input_dirs(input_dirs):
+        for parquet_file in sorted(Path(input_dir).glob("*.parquet")):
+            files[parquet_file.stem].append(parquet_file)
+    return files
+
+
+def stage_table_files(cursor, stage_name: str, table_name: str, files: List[Path]) -> str:
+    """
+    Upload a table's files under its own stage prefix, replacing earlier uploads.
+
+    Files from different directories share names (games.parquet), so each
+    gets a numbered sub-prefix.
+
+    Returns:
+        The table's stage prefix
+    """
+    prefix = f"{table_name}/"
+    cursor.execute(f"REMOVE @{stage_name}/{prefix}")
+    for number, parquet_file in enumerate(files):
+        logger.info(f"Uploading {parquet_file} to stage...")
+        cursor.execute(
+            f"PUT file://{parquet_file.absolute()} @{stage_name}/{prefix}{number:04d} "
+            f"AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+        )
+    return prefix
+
+
 def load_parquet_to_snowflake(
-    input_dir: str,
+    input_dirs: List[str],
     drop_tables: bool = False,
+    validate: bool = False,
 ):
     """
     Load Parquet files to Snowflake using PUT and COPY INTO.
 
     Args:
-        input_dir: Directory containing Parquet files
+        input_dirs: Directories (or glob patterns) containing Parquet files
         drop_tables: Whether to drop existing tables (forces full replace for all)
+        validate: Run validate_parquet.py checks first and skip rejected files
     """
     config = get_snowflake_config()
+    if isinstance(input_dirs, str):
+        input_dirs = [input_dirs]
 
-    # Define which tables should be full replace vs incremental
-    FULL_REPLACE_TABLES = {'team_rosters', 'current_standings', 'current_teams', 'season_schedules'}
+    if validate:
+        for input_dir in expand_input_dirs(input_dirs):
+            rejected = validate_directory(input_dir)
+            for file_name in rejected:
+                logger.warning(f"Skipping rejected file {input_dir}/{file_name} (moved to rejected/)")
 
     logger.info("=" * 70)
     logger.info("Loading Parquet Files to Snowflake")
     logger.info("=" * 70)
-    logger.info(f"Input directory: {input_dir}")
+    logger.info(f"Input directories: {', '.join(input_dirs)}")
     logger.info(f"Target: {config['database']}.{config['schema']}")
     logger.info(f"Drop tables: {drop_tables}")
     logger.info(f"Full replace tables: {', '.join(FULL_REPLACE_TABLES)}")
@@ -139,169 +451,30 @@ def load_parquet_to_snowflake(
         # Create stage for file uploads
         stage_name = "nhl_parquet_stage"
         logger.info(f"\nCreating stage: {stage_name}")
-        cursor.execute(f"CREATE STAGE IF NOT EXISTS {stage_name}")
+        create_stage(cursor, stage_name)
 
         # Get all parquet files
-        parquet_files = list(Path(input_dir).glob("*.parquet"))
-        logger.info(f"\nFound {len(parquet_files)} Parquet files")
-
-        for parquet_file in parquet_files:
-            table_name = parquet_file.stem  # filename without extension
+        table_files = collect_parquet_files(input_dirs)
+        logger.info(
+            f"\nFound {sum(len(files) for files in table_files.values())} Parquet files "
+            f"for {len(table_files)} tables"
+        )
 
+        for table_name, files in table_files.items():
             logger.info(f"\n{'='*70}")
-            logger.info(f"Loading {table_name}")
+            logger.info(f"Loading {table_name} ({len(files)} file(s))")
             logger.info(f"{'='*70}")
 
-            # Determine if this should be full replace or incremental
-            is_full_replace = drop_tables or table_name in FULL_REPLACE_TABLES
-
-            if is_full_replace:
-                logger.info(f"Mode: FULL REPLACE")
-            else:
-                logger.info(f"Mode: INCREMENTAL APPEND")
-
-            # Upload file to stage
-            logger.info(f"Uploading {parquet_file.name} to stage...")
-            cursor.execute(f"PUT file://{parquet_file.absolute()} @{stage_name} AUTO_COMPRESS=FALSE OVERWRITE=TRUE")
-
-            # First create file format if not exists
-            cursor.execute("""
-            CREATE FILE FORMAT IF NOT EXISTS nhl_parquet_format
-            TYPE = PARQUET
-            """)
-
-            if is_full_replace:
-                # Full replace mode: drop and recreate table
-                logger.info(f"Creating/replacing table {table_name}...")
-
-                create_sql = f"""
-                CREATE OR REPLACE TABLE {table_name}
-                USING TEMPLATE (
-                    SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
-                    FROM TABLE(
-                        INFER_SCHEMA(
-                            LOCATION => '@{stage_name}/{parquet_file.name}',
-                            FILE_FORMAT => 'nhl_parquet_format'
-                        )
-                    )
-                )
-                """
-                cursor.execute(create_sql)
-
-                # Load data using COPY INTO
-                logger.info(f"Loading data into {table_name}...")
-                copy_sql = f"""
-                COPY INTO {table_name}
-                FROM @{stage_name}/{parquet_file.name}
-                FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
-                MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
-                ON_ERROR = CONTINUE
-                """
-                cursor.execute(copy_sql)
-
-            else:
-                # Incremental mode: create table if not exists, then append
-                # Check if table exists
-                cursor.execute(f"""
-                    SELECT COUNT(*)
-                    FROM INFORMATION_SCHEMA.TABLES
-                    WHERE TABLE_SCHEMA = '{config['schema'].upper()}'
-                    AND TABLE_NAME = '{table_name.upper()}'
-                """)
-                table_exists = cursor.fetchone()[0] > 0
-
-                if not table_exists:
-                    # Create table for the first time
-                    logger.info(f"Table doesn't exist. Creating {table_name}...")
-                    create_sql = f"""
-                    CREATE TABLE {table_name}
-                    USING TEMPLATE (
-                        SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
-                        FROM TABLE(
-                            INFER_SCHEMA(
-                                LOCATION => '@{stage_name}/{parquet_file.name}',
-                                FILE_FORMAT => 'nhl_parquet_format'
-                            )
-                        )
-                    )
-                    """
-                    cursor.execute(create_sql)
-
-                    # Load initial data
-                    logger.info(f"Loading initial data into {table_name}...")
-                    copy_sql = f"""
-                    COPY INTO {table_name}
-                    FROM @{stage_name}/{parquet_file.name}
-                    FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
-                    MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
-                    ON_ERROR = CONTINUE
-                    """
-                    cursor.execute(copy_sql)
-
-                else:
-                    # Table exists - handle schema drift and do incremental load
-                    logger.info(f"Table exists. Checking for schema changes...")
-
-                    # Get columns from parquet file and existing table
-                    parquet_cols = get_parquet_columns(cursor, stage_name, parquet_file.name)
-                    table_cols = get_table_columns(cursor, config['schema'], table_name)
-
-                    logger.info(f"  Parquet has {len(parquet_cols)} columns, table has {len(table_cols)} columns")
-
-                    # Add any new columns from parquet to the table
-                    added_cols = add_missing_columns(cursor, table_name, parquet_cols, table_cols)
-                    if added_cols:
-                        logger.info(f"  Added {len(added_cols)} new column(s) to table")
-                        # Refresh table columns after adding new ones
-                        table_cols = get_table_columns(cursor, config['schema'], table_name)
-
-                    # Find columns that exist in BOTH parquet and table (for INSERT)
-                    common_cols = set(parquet_cols.keys()) & set(table_cols.keys())
-                    missing_in_parquet = set(table_cols.keys()) - set(parquet_cols.keys())
-
-                    if missing_in_parquet:
-                        logger.info(f"  Columns in table but not in parquet (will be NULL): {missing_in_parquet}")
-
-                    # Create temp table from parquet schema
-                    temp_table = f"{table_name}_temp"
-                    create_temp_sql = f"""
-                    CREATE OR REPLACE TABLE {temp_table}
-                    USING TEMPLATE (
-                        SELECT ARRAY_AGG(OBJECT_CONSTRUCT(*))
-                        FROM TABLE(
-                            INFER_SCHEMA(
-                                LOCATION => '@{stage_name}/{parquet_file.name}',
-                                FILE_FORMAT => 'nhl_parquet_format'
-                            )
-                        )
-                    )
-                    """
-                    cursor.execute(create_temp_sql)
-
-                    # Load data into temp table
-                    logger.info(f"Loading data into temp table...")
-                    copy_temp_sql = f"""
-                    COPY INTO {temp_table}
-                    FROM @{stage_name}/{parquet_file.name}
-                    FILE_FORMAT = (FORMAT_NAME = 'nhl_parquet_format')
-                    MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
-                    ON_ERROR = CONTINUE
-                    """
-                    cursor.execute(copy_temp_sql)
-
-                    # Get count of new records
-                    cursor.execute(f"SELECT COUNT(*) FROM {temp_table}")
-                    new_records = cursor.fetchone()[0]
-
-                    # Build column list for INSERT (only columns that exist in both)
-                    col_list = ', '.join(f'"{col}"' for col in sorted(common_cols))
-
-                    # Append from temp table to main table using explicit column list
-                    logger.info(f"Appending {new_records} new records to {table_name} ({len(common_cols)} columns)...")
-                    cursor.execute(f"INSERT INTO {table_name} ({col_list}) SELECT {col_list} FROM {temp_table}")
-
-                    # Drop temp table
-                    cursor.execute(f"DROP TABLE {temp_table}")
+            prefix = stage_table_files(cursor, stage_name, table_name, files)
+
+            load_staged_files(
+                cursor,
+                stage_name,
+                prefix,
+                table_name,
+                config['schema'],
+                replace=drop_tables or table_name in FULL_REPLACE_TABLES,
+            )
 
             # Get final row count
             cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
@@ -326,21 +499,28 @@ def main():
     parser.add_argument(
         '--input-dir',
         type=str,
-        default='./data',
-        help='Directory containing Parquet files (default: ./data)'
+        nargs='+',
+        default=['./data'],
+        help='Directories or quoted glob patterns containing Parquet files (default: ./data)'
     )
     parser.add_argument(
         '--drop-tables',
         action='store_true',
         help='Force full replace for ALL tables (default: only replace team_rosters, current_standings, current_teams)'
     )
+    parser.add_argument(
+        '--validate',
+        action='store_true',
+        help='Validate files first (validate_parquet.py) and skip rejected ones'
+    )
 
     args = parser.parse_args()
 
     try:
         load_parquet_to_snowflake(
-            input_dir=args.input_dir,
+            input_dirs=args.input_dir,
             drop_tables=args.drop_tables,
+            validate=args.validate,
         )
     except Exception as e:
         logger.error(f"Error during loading: {e}", exc_info=True)
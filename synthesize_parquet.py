@@ -0,0 +1,631 @@
+"""
+Synthesize Scale-Test Parquet Data from the Backfill Samples
+
+Learns the shape of the data_backfill_* files - which games are played on
+which days of a season, what a game of each type looks like across the
+games / game_summaries / game_boxscore streams, and how teams appear in them -
+and writes arbitrarily many synthetic seasons (and parallel leagues) in the
+same per-season layout:
+
+    <output-prefix>_s9899/games.parquet
+    <output-prefix>_s9899/game_summaries.parquet
+    <output-prefix>_s9899/daily_standings.parquet
+
+Each synthetic season replays the schedule of a sample season (games per day,
+game types, matchups) with the teams shuffled, the dates moved to the target
+year and every game's content drawn from a random sample game of the same
+type. Keys are consistent across streams: a game has the same id, date,
+teams and score in games, game_summaries and game_boxscore, game ids follow
+the NHL layout (2024020001) and daily_standings records and ranks are
+recomputed from the synthetic results. Seasons count back from the latest
+sample season (--seasons 40 ends with the last sample, starting 39 years
+earlier). Additional leagues copy the team set with new team
+ids and abbreviations (TOR -> TOR2).
+
+Nested payloads that aren't keys (goals, summary, player stats, broadcasts)
+are carried over from the sample game as-is. Streams without samples
+(play_by_play, rosters and the other full-replace snapshots) are not
+generated.
+
+The output loads and compacts like real backfill directories, so it can be
+used to benchmark validate_parquet.py, compact_parquet.py,
+parquet_to_snowflake.py and the dbt models at scale. Load it into its own
+schema: synthetic seasons reuse real season and game ids.
+
+Usage:
+    python synthesize_parquet.py --seasons 40 --output-prefix ./data_synthetic
+    python synthesize_parquet.py --sample ./data_backfill_s2324_flat ./data_backfill_s2425_flat \\
+        --seasons 20 --leagues 3 --output-prefix ./data_synthetic_flat --seed 7
+"""
+
+import argparse
+import os
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from compact_parquet import season_label, write_compacted
+from nhl_extractor import get_json_codec
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+GAME_STREAMS = ('games', 'game_summaries', 'game_boxscore')
+STANDINGS_STREAM = 'daily_standings'
+
+TEAM_SIDES = ('homeTeam', 'awayTeam')
+# Team attributes replaced when a sample game is relabeled to other teams
+TEAM_IDENTITY_FIELDS = {
+    'id', 'abbrev', 'name', 'commonname', 'placename', 'placenamewithpreposition', 'logo', 'darklogo'
+}
+# Team ids of league N are offset by N * TEAM_ID_LEAGUE_OFFSET
+TEAM_ID_LEAGUE_OFFSET = 100
+
+REGULAR_SEASON = 2
+FINAL_STATES = {'OFF', 'FINAL'}
+# Game ids hold a four-digit sequence per season and game type
+MAX_GAMES_PER_TYPE = 9999
+
+# Counters kept per team for daily_standings, as (total, home/road) column names
+STANDINGS_COUNTERS = {
+    'gamesPlayed': 'GamesPlayed',
+    'wins': 'Wins',
+    'losses': 'Losses',
+    'otLosses': 'OtLosses',
+    'points': 'Points',
+    'goalFor': 'GoalsFor',
+    'goalAgainst': 'GoalsAgainst',
+    'goalDifferential': 'GoalDifferential',
+}
+# Rank columns recomputed for every standings day, as
+# (column, field grouping the teams ranked together, counter prefix)
+STANDINGS_SEQUENCES = [
+    (f"{scope}{split.capitalize()}Sequence", group, split)
+    for scope, group in (('league', None), ('conference', 'conferenceName'), ('division', 'divisionName'))
+    for split in ('', 'home', 'road')
+]
+# Rank columns whose inputs are not tracked (last-10 form, wild card race,
+# waiver order); written as null rather than copied from the sample day
+UNTRACKED_SEQUENCES = (
+    'leagueL10Sequence', 'conferenceL10Sequence', 'divisionL10Sequence', 'wildcardSequence', 'waiversSequence'
+)
+
+
+@dataclass
+class SampleSeason:
+    """One sample season: its schedule and daily standings."""
+    start_year: int
+    # games rows in (date, id) order
+    games: List[Dict[str, Any]] = field(default_factory=list)
+    # date -> team abbrev -> daily_standings row
+    standings: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+
+
+@dataclass
+class SampleProfile:
+    """Everything the generator learns from the sample files."""
+    flat: bool
+    schemas: Dict[str, pa.Schema]
+    seasons: List[SampleSeason]
+    # stream -> sample game id -> row, for game streams other than games
+    game_rows: Dict[str, Dict[int, Dict[str, Any]]]
+    # game type -> sample games rows to draw game content from
+    pools: Dict[int, List[Dict[str, Any]]]
+    # team abbrev -> identity attributes in the sample layout
+    identities: Dict[str, Dict[str, Any]]
+
+
+class Layout:
+    """
+    Reads and writes fields by their nested path in either sample layout.
+
+    Nested files (nhl_to_parquet.py) keep objects as JSON strings
+    (homeTeam = '{"abbrev": ...}'); flattened files spread them over
+    upper-cased columns (HOMETEAM_ABBREV).
+    """
+
+    def __init__(self, flat: bool):
+        self.flat = flat
+        self.codec = get_json_codec('auto')
+
+    def column(self, name: str) -> str:
+        return name.upper() if self.flat else name
+
+    def get(self, row: Dict[str, Any], *path: str) -> Any:
+        if self.flat:
+            return row.get('_'.join(path).upper())
+
+        value = row.get(path[0])
+        for key in path[1:]:
+            if isinstance(value, str):
+                value = self.codec.loads(value)
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    def set(self, row: Dict[str, Any], path: Tuple[str, ...], value: Any):
+        """Set a field the row already has; absent fields are left absent."""
+        if self.flat:
+            column = '_'.join(path).upper()
+            if column in row:
+                row[column] = value
+            return
+
+        if path[0] not in row:
+            return
+        if len(path) == 1:
+            row[path[0]] = value
+            return
+        if not isinstance(row[path[0]], str):
+            return
+        document = self.codec.loads(row[path[0]])
+        target = document
+        for key in path[1:-1]:
+            target = target.get(key) if isinstance(target, dict) else None
+        if isinstance(target, dict) and path[-1] in target:
+            target[path[-1]] = value
+            row[path[0]] = self.codec.dumps(document)
+
+    def team_identity(self, row: Dict[str, Any], side: str) -> Dict[str, Any]:
+        """A team's identity attributes as they appear on one side of a game row."""
+        if self.flat:
+            prefix = f"{side.upper()}_"
+            return {
+                column[len(prefix):]: value for column, value in row.items()
+                if column.startswith(prefix) and is_identity_field(column[len(prefix):])
+            }
+
+        document = row.get(side)
+        if not isinstance(document, str):
+            return {}
+        team = self.codec.loads(document)
+        return {key: value for key, value in team.items() if is_identity_field(key)}
+
+    def replace_team(self, row: Dict[str, Any], side: str, identity: Dict[str, Any]):
+        """Swap one side of a game row to another team, keeping its score and stats."""
+        if self.flat:
+            prefix = f"{side.upper()}_"
+            for column in row:
+                key = column[len(prefix):]
+                if column.startswith(prefix) and key in identity:
+                    row[column] = identity[key]
+            return
+
+        document = row.get(side)
+        if not isinstance(document, str):
+            return
+        team = self.codec.loads(document)
+        for key in team:
+            if key in identity:
+                team[key] = identity[key]
+        row[side] = self.codec.dumps(team)
+
+
+def is_identity_field(key: str) -> bool:
+    """'abbrev', 'NAME_DEFAULT', 'PLACENAMEWITHPREPOSITION_FR', ... (not score/sog/record)."""
+    return key.split('_')[0].lower() in TEAM_IDENTITY_FIELDS
+
+
+def shift_date(value: Optional[str], years: int) -> Optional[str]:
+    """Move a 'YYYY-MM-DD...' string by whole years (Feb 29 becomes Feb 28)."""
+    if not value or years == 0:
+        return value
+    day = date.fromisoformat(value[:10])
+    try:
+        shifted = day.replace(year=day.year + years)
+    except ValueError:
+        shifted = day.replace(year=day.year + years, day=28)
+    return shifted.isoformat() + value[10:]
+
+
+def load_stream(sample_dirs: List[str], stream_name: str) -> Optional[pa.Table]:
+    """Concatenate one stream across the sample directories (None if no sample has it)."""
+    tables = []
+    for sample_dir in sample_dirs:
+        path = os.path.join(sample_dir, f"{stream_name}.parquet")
+        if os.path.exists(path):
+            tables.append(pq.read_table(path))
+    if not tables:
+        return None
+    return pa.concat_tables(tables, promote_options='permissive').replace_schema_metadata(None)
+
+
+def learn_profile(sample_dirs: List[str]) -> SampleProfile:
+    """
+    Learn schedules, game pools, team identities and schemas from sample directories.
+
+    Args:
+        sample_dirs: Directories in the nested (nhl_to_parquet.py) or the
+            flattened layout; all must use the same layout
+
+    Returns:
+        SampleProfile
+    """
+    games = load_stream(sample_dirs, 'games')
+    if games is None:
+        raise ValueError(f"No games.parquet in {', '.join(sample_dirs)}")
+
+    flat = 'ID' in games.column_names
+    layout = Layout(flat)
+    schemas = {'games': games.schema}
+    tables = {}
+    for stream_name in GAME_STREAMS[1:] + (STANDINGS_STREAM,):
+        table = load_stream(sample_dirs, stream_name)
+        if table is None:
+            continue
+        if ('ID' in table.column_names or 'DATE' in table.column_names) != flat:
+            raise ValueError(f"{stream_name} samples mix the nested and flattened layouts")
+        schemas[stream_name] = table.schema
+        tables[stream_name] = table
+
+    seasons: Dict[int, SampleSeason] = {}
+    pools = defaultdict(list)
+    identities: Dict[str, Dict[str, Any]] = defaultdict(dict)
+
+    game_list = games.to_pylist()
+    game_list.sort(key=lambda row: (layout.get(row, 'gameDate') or '', layout.get(row, 'id')))
+    for row in game_list:
+        season = layout.get(row, 'season')
+        start_year = season // 10000
+        seasons.setdefault(start_year, SampleSeason(start_year)).games.append(row)
+        pools[layout.get(row, 'gameType')].append(row)
+
+    game_rows = {}
+    for stream_name, table in tables.items():
+        if stream_name == STANDINGS_STREAM:
+            continue
+        game_rows[stream_name] = {layout.get(row, 'id'): row for row in table.to_pylist()}
+
+    # Identities merged over every stream, since each carries different team attributes
+    for rows in [game_list] + [list(rows.values()) for rows in game_rows.values()]:
+        for row in rows:
+            for side in TEAM_SIDES:
+                abbrev = layout.get(row, side, 'abbrev')
+                if abbrev:
+                    identities[abbrev].update(layout.team_identity(row, side))
+
+    if STANDINGS_STREAM in tables:
+        for row in tables[STANDINGS_STREAM].to_pylist():
+            start_year = layout.get(row, 'seasonId') // 10000
+            if start_year in seasons:
+                standings = seasons[start_year].standings
+                standings.setdefault(layout.get(row, 'date'), {})[layout.get(row, 'teamAbbrev', 'default')] = row
+
+    return SampleProfile(
+        flat=flat,
+        schemas=schemas,
+        seasons=[seasons[year] for year in sorted(seasons)],
+        game_rows=game_rows,
+        pools=dict(pools),
+        identities=dict(identities),
+    )
+
+
+class SeasonSynthesizer:
+    """Builds the rows of one synthetic season from a sample season."""
+
+    def __init__(self, profile: SampleProfile, source: SampleSeason, start_year: int,
+                 leagues: int, rng: random.Random):
+        self.profile = profile
+        self.layout = Layout(profile.flat)
+        self.source = source
+        self.start_year = start_year
+        self.season = start_year * 10000 + start_year + 1
+        self.years = start_year - source.start_year
+        self.leagues = leagues
+        self.rng = rng
+        self.rows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.standings_dates = set()
+        self.sequences: Dict[int, int] = defaultdict(int)
+        self.loaded_at = datetime.now(timezone.utc)
+
+        # Per league: sample team -> the sample team whose identity it plays
+        # under. Standings teams only swap among themselves.
+        standings_teams = sorted({team for day in source.standings.values() for team in day})
+        self.assignments = []
+        for _ in range(leagues):
+            shuffled = standings_teams[:]
+            rng.shuffle(shuffled)
+            self.assignments.append(dict(zip(standings_teams, shuffled)))
+        self.counters = [defaultdict(lambda: defaultdict(int)) for _ in range(leagues)]
+
+    def team(self, league: int, abbrev: str) -> Tuple[str, Dict[str, Any]]:
+        """Synthetic (abbrev, identity) playing a sample team's slot in a league."""
+        base = self.assignments[league].get(abbrev, abbrev)
+        identity = dict(self.profile.identities.get(base, {}))
+        synthetic = f"{base}{league + 1}" if league else base
+        for key in list(identity):
+            if key.lower() == 'abbrev':
+                identity[key] = synthetic
+            elif key.lower() == 'id' and identity[key] is not None:
+                identity[key] += league * TEAM_ID_LEAGUE_OFFSET
+        return synthetic, identity
+
+    def _stamp(self, stream_name: str, row: Dict[str, Any]):
+        """Set the ETL load-time columns in whatever type the sample schema uses."""
+        schema = self.profile.schemas[stream_name]
+        for name in ('_etl_loaded_at', '_loaded_at'):
+            column = self.layout.column(name)
+            if column in row:
+                # UTC either way: naive timestamps, offset-qualified ISO text
+                is_timestamp = pa.types.is_timestamp(schema.field(column).type)
+                row[column] = self.loaded_at.replace(tzinfo=None) if is_timestamp else self.loaded_at.isoformat()
+
+    def next_game_id(self, game_type: int) -> int:
+        self.sequences[game_type] += 1
+        if self.sequences[game_type] > MAX_GAMES_PER_TYPE:
+            raise ValueError(
+                f"More than {MAX_GAMES_PER_TYPE} games of type {game_type} in {self.season}; "
+                f"use fewer leagues"
+            )
+        return int(f"{self.start_year}{game_type:02d}{self.sequences[game_type]:04d}")
+
+    def add_game(self, league: int, scheduled: Dict[str, Any]):
+        """Emit one synthetic game in every game stream and update the standings counters."""
+        layout = self.layout
+        game_type = layout.get(scheduled, 'gameType')
+        template = self.rng.choice(self.profile.pools[game_type])
+        template_id = layout.get(template, 'id')
+
+        game_id = self.next_game_id(game_type)
+        game_date = shift_date(layout.get(scheduled, 'gameDate'), self.years)
+        teams = {
+            side: self.team(league, layout.get(scheduled, side, 'abbrev'))
+            for side in TEAM_SIDES
+        }
+
+        for stream_name in GAME_STREAMS:
+            if stream_name == 'games':
+                source_row = template
+            else:
+                source_row = self.profile.game_rows.get(stream_name, {}).get(template_id)
+            if source_row is None:
+                continue
+
+            row = dict(source_row)
+            layout.set(row, ('id',), game_id)
+            layout.set(row, ('game_id',), game_id)
+            layout.set(row, ('season',), self.season)
+            layout.set(row, ('gameDate',), game_date)
+            layout.set(row, ('date',), game_date)
+            layout.set(row, ('startTimeUTC',), shift_date(layout.get(scheduled, 'startTimeUTC'), self.years))
+            for side, (_, identity) in teams.items():
+                layout.replace_team(row, side, identity)
+            if layout.get(row, 'gameCenterLink'):
+                home, away = teams['homeTeam'][0].lower(), teams['awayTeam'][0].lower()
+                layout.set(row, ('gameCenterLink',),
+                           f"/gamecenter/{away}-vs-{home}/{game_date.replace('-', '/')}/{game_id}")
+            self._stamp(stream_name, row)
+            self.rows[stream_name].append(row)
+
+        if game_type == REGULAR_SEASON and layout.get(template, 'gameState') in FINAL_STATES:
+            self._count_result(league, template, teams['homeTeam'][0], teams['awayTeam'][0])
+
+    def _count_result(self, league: int, template: Dict[str, Any], home: str, away: str):
+        layout = self.layout
+        home_score = layout.get(template, 'homeTeam', 'score') or 0
+        away_score = layout.get(template, 'awayTeam', 'score') or 0
+        extra_time = layout.get(template, 'gameOutcome', 'lastPeriodType') in ('OT', 'SO')
+
+        for team, split, goals_for, goals_against in (
+            (home, 'home', home_score, away_score),
+            (away, 'road', away_score, home_score),
+        ):
+            won = goals_for > goals_against
+            result = {
+                'GamesPlayed': 1,
+                'Wins': int(won),
+                'Losses': int(not won and not extra_time),
+                'OtLosses': int(not won and extra_time),
+                'Points': 2 if won else int(extra_time),
+                'GoalsFor': goals_for,
+                'GoalsAgainst': goals_against,
+                'GoalDifferential': goals_for - goals_against,
+            }
+            counters = self.counters[league][team]
+            for counter, value in result.items():
+                counters[counter] += value
+                counters[f"{split}{counter}"] += value
+
+    def add_standings(self, sample_date: str):
+        """Emit every team's standings row for a date, from the results so far."""
+        layout = self.layout
+        templates = self.source.standings.get(sample_date)
+        standings_date = shift_date(sample_date, self.years)
+        # Feb 29 of a sample leap year lands on the Feb 28 already written
+        if not templates or standings_date in self.standings_dates:
+            return
+        self.standings_dates.add(standings_date)
+
+        for league in range(self.leagues):
+            day_rows = []
+            for sample_team in templates:
+                synthetic, _ = self.team(league, sample_team)
+                base = self.assignments[league].get(sample_team, sample_team)
+                row = dict(templates.get(base, templates[sample_team]))
+                counters = self.counters[league][synthetic]
+
+                layout.set(row, ('date',), standings_date)
+                layout.set(row, ('seasonId',), self.season)
+                layout.set(row, ('teamAbbrev', 'default'), synthetic)
+                for total, counter in STANDINGS_COUNTERS.items():
+                    layout.set(row, (total,), counters[counter])
+                    for split in ('home', 'road'):
+                        layout.set(row, (f"{split}{counter}",), counters[f"{split}{counter}"])
+
+                games_played = counters['GamesPlayed']
+                layout.set(row, ('pointPctg',), counters['Points'] / (2 * games_played) if games_played else 0.0)
+                layout.set(row, ('winPctg',), counters['Wins'] / games_played if games_played else 0.0)
+                layout.set(row, ('goalsForPctg',), counters['GoalsFor'] / games_played if games_played else 0.0)
+                layout.set(row, ('goalDifferentialPctg',),
+                           counters['GoalDifferential'] / games_played if games_played else 0.0)
+                for column in UNTRACKED_SEQUENCES:
+                    layout.set(row, (column,), None)
+                self._stamp(STANDINGS_STREAM, row)
+                day_rows.append((counters, row))
+
+            for column, group, split in STANDINGS_SEQUENCES:
+                ranked = sorted(
+                    day_rows,
+                    key=lambda item: (item[0][f"{split}Points"], item[0][f"{split}GoalDifferential"]),
+                    reverse=True
+                )
+                ranks = defaultdict(int)
+                for _, row in ranked:
+                    key = layout.get(row, group) if group else None
+                    ranks[key] += 1
+                    layout.set(row, (column,), ranks[key])
+            self.rows[STANDINGS_STREAM].extend(row for _, row in day_rows)
+
+    def build(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Replay the sample season day by day; standings reflect games before each date."""
+        games_by_date = defaultdict(list)
+        for scheduled in self.source.games:
+            games_by_date[self.layout.get(scheduled, 'gameDate')].append(scheduled)
+
+        for sample_date in sorted(set(games_by_date) | set(self.source.standings)):
+            if STANDINGS_STREAM in self.profile.schemas:
+                self.add_standings(sample_date)
+            for league in range(self.leagues):
+                for scheduled in games_by_date.get(sample_date, []):
+                    self.add_game(league, scheduled)
+        return self.rows
+
+
+def synthesize(sample_dirs: List[str], output_prefix: str, seasons: int = 2, leagues: int = 1,
+               seed: Optional[int] = None, row_group_mb: float = 16):
+    """
+    Write synthetic per-season Parquet directories shaped like the samples.
+
+    Args:
+        sample_dirs: Sample directories (data_backfill_* or their _flat variants)
+        output_prefix: Prefix of the per-season output directories
+            ('<output_prefix>_s2425/')
+        seasons: Number of seasons, ending with the latest sample season
+        leagues: Parallel copies of the team set per season
+        seed: Random seed for reproducible output
+        row_group_mb: Target uncompressed row-group size in MiB
+    """
+    if not 1 <= seasons <= 100:
+        # Directory labels (s2425) repeat after a century
+        raise ValueError("seasons must be between 1 and 100")
+    if leagues < 1:
+        raise ValueError("leagues must be at least 1")
+
+    started = time.perf_counter()
+    profile = learn_profile(sample_dirs)
+    rng = random.Random(seed)
+    last_year = profile.seasons[-1].start_year
+
+    logger.info("=" * 70)
+    logger.info("Synthesizing Scale-Test Parquet Data")
+    logger.info("=" * 70)
+    logger.info(f"Samples: {', '.join(sample_dirs)} ({'flattened' if profile.flat else 'nested'} layout)")
+    logger.info(f"Sample seasons: {', '.join(str(s.start_year) for s in profile.seasons)}")
+    logger.info(f"Streams: {', '.join(profile.schemas)}")
+    logger.info(f"Output: {seasons} season(s) x {leagues} league(s) -> {output_prefix}_s<season>/")
+    logger.info("=" * 70)
+
+    totals = defaultdict(int)
+    total_bytes = 0
+    for index in range(seasons):
+        start_year = last_year - seasons + 1 + index
+        source = profile.seasons[index % len(profile.seasons)]
+        rows = SeasonSynthesizer(profile, source, start_year, leagues, rng).build()
+
+        output_dir = f"{output_prefix}_{season_label(start_year * 10000 + start_year + 1)}"
+        os.makedirs(output_dir, exist_ok=True)
+        for stream_name, stream_rows in rows.items():
+            output_file = os.path.join(output_dir, f"{stream_name}.parquet")
+            table = pa.Table.from_pylist(stream_rows, schema=profile.schemas[stream_name])
+            write_compacted(table, output_file, row_group_mb)
+            totals[stream_name] += table.num_rows
+            total_bytes += os.path.getsize(output_file)
+
+        logger.info(
+            f"✓ {output_dir}: {start_year}-{start_year + 1} from sample {source.start_year}, "
+            + ", ".join(f"{len(stream_rows)} {name}" for name, stream_rows in rows.items())
+        )
+
+    elapsed = time.perf_counter() - started
+    logger.info("\n" + "=" * 70)
+    logger.info("Synthesis complete!")
+    logger.info("=" * 70)
+    for stream_name, count in totals.items():
+        logger.info(f"  {stream_name}: {count} rows")
+    logger.info(f"  {total_bytes / 1024 / 1024:.1f} MiB in {elapsed:.1f}s "
+                f"({sum(totals.values()) / elapsed:.0f} rows/s)")
+    logger.info("=" * 70)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic per-season Parquet data shaped like the backfill samples'
+    )
+    parser.add_argument(
+        '--sample',
+        nargs='+',
+        default=['./data_backfill_s2324', './data_backfill_s2425'],
+        help='Sample directories, all nested or all _flat (default: ./data_backfill_s2324 ./data_backfill_s2425)'
+    )
+    parser.add_argument(
+        '--output-prefix',
+        type=str,
+        default='./data_synthetic',
+        help='Prefix for per-season output directories (default: ./data_synthetic -> ./data_synthetic_s2425/)'
+    )
+    parser.add_argument(
+        '--seasons',
+        type=int,
+        default=2,
+        help='Number of seasons to generate, ending with the latest sample season (default: 2, max 100)'
+    )
+    parser.add_argument(
+        '--leagues',
+        type=int,
+        default=1,
+        help='Parallel leagues per season, each with its own copy of the teams (default: 1)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Random seed for reproducible output'
+    )
+    parser.add_argument(
+        '--row-group-mb',
+        type=float,
+        default=16,
+        help='Target uncompressed row-group size in MiB (default: 16)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        synthesize(
+            sample_dirs=args.sample,
+            output_prefix=args.output_prefix,
+            seasons=args.seasons,
+            leagues=args.leagues,
+            seed=args.seed,
+            row_group_mb=args.row_group_mb,
+        )
+    except Exception as e:
+        logger.error(f"Error during synthesis: {e}", exc_info=True)
+        raise
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Tests for the NHL API clients and extractors (run with: python -m pytest -q test_nhl_extractor.py)
+
+Responses are served by httpx.MockTransport; nothing touches the network.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import nhl_extractor
+from nhl_extractor import NHLAPIClient
+from nhl_extractor_async import AsyncNHLAPIClient, AsyncNHLExtractor
+
+# The */now and */current endpoints the extractor reads, and where the API sends them
+REDIRECTED_ENDPOINTS = {
+    'standings/now': 'standings/2024-11-04',
+    'schedule-calendar/now': 'schedule-calendar/2024-11-04',
+    'roster/TOR/current': 'roster/TOR/20242025',
+    'club-schedule-season/TOR/now': 'club-schedule-season/TOR/20242025',
+}
+
+
+def serve_redirects(request: httpx.Request) -> httpx.Response:
+    """Answer 307 for the redirecting endpoints and echo the path everywhere else."""
+    endpoint = request.url.path.removeprefix('/v1/')
+    if endpoint in REDIRECTED_ENDPOINTS:
+        location = f"{NHLAPIClient.BASE_URL}/{REDIRECTED_ENDPOINTS[endpoint]}"
+        return httpx.Response(307, headers={'location': location})
+    return httpx.Response(200, json={'endpoint': endpoint})
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Route every httpx client the extractors build through serve_redirects."""
+    for name in ('Client', 'AsyncClient'):
+        client_class = getattr(httpx, name)
+        transport_class = httpx.MockTransport
+
+        def build(*args, client_class=client_class, transport_class=transport_class, **kwargs):
+            return client_class(*args, transport=transport_class(serve_redirects), **kwargs)
+
+        monkeypatch.setattr(httpx, name, build)
+
+
+@pytest.mark.skipif(not nhl_extractor.H2_AVAILABLE, reason='requires httpx[http2]')
+@pytest.mark.parametrize('endpoint', sorted(REDIRECTED_ENDPOINTS))
+def test_http2_client_follows_redirects(mock_transport, endpoint):
+    client = NHLAPIClient(request_delay=0, max_retries=1, http2=True)
+    try:
+        assert client.get(endpoint) == {'endpoint': REDIRECTED_ENDPOINTS[endpoint]}
+        assert client.pop_failure(endpoint) is None
+    finally:
+        client.close()
+
+
+@pytest.mark.parametrize('endpoint', sorted(REDIRECTED_ENDPOINTS))
+def test_async_client_follows_redirects(mock_transport, endpoint):
+    async def fetch():
+        client = AsyncNHLAPIClient(request_delay=0, max_retries=1)
+        try:
+            return await client.get(endpoint), client.pop_failure(endpoint)
+        finally:
+            await client.aclose()
+
+    data, failure = asyncio.run(fetch())
+    assert data == {'endpoint': REDIRECTED_ENDPOINTS[endpoint]}
+    assert failure is None
+
+
+def serve_games(failing: set):
+    """Two games a day, boxscores for each; endpoints in failing answer 500."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.removeprefix('/v1/')
+        if endpoint in failing:
+            return httpx.Response(500)
+        if endpoint.startswith('score/'):
+            day = int(endpoint[-2:])
+            games = [{'id': 2024020000 + day * 10 + n, 'season': 20242025, 'gameState': 'OFF'} for n in (1, 2)]
+            return httpx.Response(200, json={'games': games})
+        if endpoint.startswith('gamecenter/'):
+            return httpx.Response(200, json={'id': int(endpoint.split('/')[1]), 'season': 20242025})
+        return httpx.Response(404)
+    return handler
+
+
+def test_async_retry_dead_letters(monkeypatch):
+    failing = {'score/2024-11-05', 'gamecenter/2024020041/boxscore'}
+    client_class = httpx.AsyncClient
+    monkeypatch.setattr(httpx, 'AsyncClient', lambda *args, **kwargs: client_class(
+        *args, transport=httpx.MockTransport(serve_games(failing)), **kwargs
+    ))
+    extractor_kwargs = dict(start_date='2024-11-04', end_date='2024-11-06',
+                            request_delay=0, max_retries=1, retry_delay=0)
+
+    async def run():
+        async with AsyncNHLExtractor(**extractor_kwargs) as extractor:
+            games = await extractor.extract_stream('games')
+            boxscores = await extractor.extract_stream('game_boxscore')
+            dead_letters = extractor.dead_letters
+
+        failing.clear()
+        async with AsyncNHLExtractor(**extractor_kwargs) as extractor:
+            # The boxscore letter is listed twice but fetched once
+            recovered = await extractor.retry_dead_letters(dead_letters + dead_letters[-1:])
+            return games, boxscores, dead_letters, recovered, extractor.dead_letters
+
+    games, boxscores, dead_letters, recovered, still_failing = asyncio.run(run())
+    assert [g['id'] for g in games] == [2024020041, 2024020042, 2024020061, 2024020062]
+    assert [b['game_id'] for b in boxscores] == [2024020042, 2024020061, 2024020062]
+    assert [(d['stream'], d['partition_value']) for d in dead_letters] == [
+        ('games', '2024-11-05'), ('game_boxscore', 2024020041),
+    ]
+    assert [g['id'] for g in recovered['games']] == [2024020051, 2024020052]
+    # Boxscores of the recovered date, then the retried boxscore
+    assert [b['game_id'] for b in recovered['game_boxscore']] == [2024020051, 2024020052, 2024020041]
+    assert still_failing == []
@@ -0,0 +1,350 @@
+"""
+Validate Parquet Files Before Loading
+
+Runs declarative per-stream checks over the files written by nhl_to_parquet.py
+(or the flattened backfill / live-poller layouts) with pyarrow.compute, so bad
+batches are caught before they cost warehouse time and a dbt rebuild:
+
+    - key uniqueness (and no null keys)
+    - null rates of required columns
+    - value ranges (percentages, games played, ...)
+    - empty JSON arrays (e.g. play_by_play with no plays)
+    - row-count change vs. the previous validated run of full-replace streams
+
+Only the columns a check needs are read, so a run takes milliseconds. Files
+that fail are moved to <input-dir>/rejected/, where parquet_to_snowflake.py
+won't pick them up, and the script exits non-zero.
+
+Usage:
+    python validate_parquet.py --input-dir ./data
+    python parquet_to_snowflake.py --input-dir ./data --validate
+"""
+
+import argparse
+import json
+import os
+import logging
+import shutil
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+STATE_FILE = '_validation_state.json'
+REJECTED_DIR = 'rejected'
+
+# JSON-encoded nested columns that carry no data
+EMPTY_JSON_VALUES = pa.array(['', '[]', '{}', 'null'])
+
+
+@dataclass(frozen=True)
+class StreamChecks:
+    """
+    Declarative checks for one stream's parquet file.
+
+    Column names match case-insensitively, and 'a|b' accepts whichever of the
+    alternatives the file has (nested vs. flattened layouts). Key and not-null
+    columns must exist; range and empty-array checks skip absent columns.
+    """
+    keys: Tuple[str, ...] = ()
+    not_null: Tuple[str, ...] = ()
+    # column -> (min, max); None leaves that side open
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]] = field(default_factory=dict)
+    # column -> maximum fraction of rows whose JSON array/object is null or empty
+    max_empty_rate: Dict[str, float] = field(default_factory=dict)
+    # Maximum relative row-count change vs. the previous validated run
+    max_row_delta: Optional[float] = None
+
+
+STANDINGS_RANGES = {
+    'gamesPlayed': (0, 84),
+    'points': (0, 168),
+    'pointPctg': (0, 1),
+    'winPctg': (0, 1),
+    'regulationWinPctg': (0, 1),
+    'regulationPlusOtWinPctg': (0, 1),
+}
+
+GAME_DOCUMENT_RANGES = {
+    'homeTeam_score': (0, 30),
+    'awayTeam_score': (0, 30),
+    'homeTeam_sog': (0, 100),
+    'awayTeam_sog': (0, 100),
+}
+
+STREAM_CHECKS = {
+    'current_standings': StreamChecks(
+        keys=('teamAbbrev|teamAbbrev_default',),
+        ranges=STANDINGS_RANGES,
+        max_row_delta=0.1,
+    ),
+    'current_teams': StreamChecks(
+        keys=('id',),
+        not_null=('abbrev',),
+        max_row_delta=0.1,
+    ),
+    'team_rosters': StreamChecks(
+        keys=('team_abv',),
+        max_empty_rate={'forwards': 0, 'defensemen': 0, 'goalies': 0},
+        max_row_delta=0.1,
+    ),
+    'season_schedules': StreamChecks(
+        keys=('id', 'team_abv'),
+        not_null=('season', 'gameDate'),
+        max_row_delta=0.25,
+    ),
+    'games': StreamChecks(
+        keys=('id',),
+        not_null=('season', 'gameDate', 'gameState'),
+    ),
+    'daily_standings': StreamChecks(
+        keys=('date', 'teamAbbrev|teamAbbrev_default'),
+        not_null=('seasonId',),
+        ranges=STANDINGS_RANGES,
+    ),
+    'game_boxscore': StreamChecks(
+        keys=('id',),
+        not_null=('season', 'gameState'),
+        ranges=GAME_DOCUMENT_RANGES,
+    ),
+    'game_summaries': StreamChecks(
+        keys=('id',),
+        not_null=('season', 'gameState'),
+        ranges={
+            **GAME_DOCUMENT_RANGES,
+            'pregameMatchup_teamSeasonStats_homeTeam_ppPctg': (0, 1),
+            'pregameMatchup_teamSeasonStats_homeTeam_pkPctg': (0, 1),
+            'pregameMatchup_teamSeasonStats_awayTeam_ppPctg': (0, 1),
+            'pregameMatchup_teamSeasonStats_awayTeam_pkPctg': (0, 1),
+        },
+    ),
+    # Nightly files hold one document per game (id); live-poller batches
+    # hold one row per event (eventId, GAME_ID)
+    'play_by_play': StreamChecks(
+        keys=('id|eventId', 'game_id'),
+        max_empty_rate={'plays': 0.25},
+    ),
+}
+
+# Raw passthrough files (nhl_to_parquet.py --passthrough) share one layout
+RAW_CHECKS = StreamChecks(
+    keys=('game_id',),
+    not_null=('season',),
+    max_empty_rate={'payload': 0},
+)
+
+
+def checks_for(stream_name: str) -> Optional[StreamChecks]:
+    """Look up the checks for a stream (None if it has none)."""
+    if stream_name.endswith('_raw'):
+        return RAW_CHECKS
+    return STREAM_CHECKS.get(stream_name)
+
+
+def resolve_column(spec: str, columns: Dict[str, str]) -> Optional[str]:
+    """
+    Find the file column for a check column spec.
+
+    Args:
+        spec: Column name, or 'a|b' alternatives
+        columns: dict mapping lower-cased column name -> actual column name
+
+    Returns:
+        The actual column name, or None if no alternative is present
+    """
+    for name in spec.split('|'):
+        if name.lower() in columns:
+            return columns[name.lower()]
+    return None
+
+
+def validate_file(path: Path, checks: StreamChecks,
+                  previous_rows: Optional[int] = None) -> Tuple[int, List[str]]:
+    """
+    Run a stream's checks against one parquet file.
+
+    Args:
+        path: Parquet file
+        checks: Checks to run
+        previous_rows: Row count from the previous validated run, if any
+
+    Returns:
+        (row count, list of failure messages; empty when the file passes)
+    """
+    schema = pq.read_schema(path)
+    columns = {name.lower(): name for name in schema.names}
+    errors = []
+
+    keys = [resolve_column(spec, columns) for spec in checks.keys]
+    not_null = [resolve_column(spec, columns) for spec in checks.not_null]
+    for spec, column in zip(checks.keys + checks.not_null, keys + not_null):
+        if column is None:
+            errors.append(f"missing required column {spec}")
+    keys = [column for column in keys if column]
+    not_null = [column for column in not_null if column]
+
+    ranges = {resolve_column(spec, columns): bounds for spec, bounds in checks.ranges.items()}
+    ranges.pop(None, None)
+    empty_rates = {resolve_column(spec, columns): rate for spec, rate in checks.max_empty_rate.items()}
+    empty_rates.pop(None, None)
+
+    needed = sorted(set(keys) | set(not_null) | set(ranges) | set(empty_rates))
+    table = pq.read_table(path, columns=needed)
+    rows = table.num_rows
+
+    # Keys: never null, unique together
+    for column in keys + not_null:
+        nulls = table[column].null_count
+        if nulls:
+            errors.append(f"{column}: {nulls} null value(s)")
+    if keys and rows:
+        distinct = table.group_by(keys).aggregate([]).num_rows
+        if distinct < rows:
+            errors.append(f"{rows - distinct} duplicate key(s) on ({', '.join(keys)})")
+
+    # Value ranges
+    for column, (low, high) in ranges.items():
+        values = table[column]
+        if not (pa.types.is_integer(values.type) or pa.types.is_floating(values.type)):
+            errors.append(f"{column}: expected numeric values, got {values.type}")
+            continue
+        out_of_range = pa.scalar(False)
+        if low is not None:
+            out_of_range = pc.or_(out_of_range, pc.less(values, low))
+        if high is not None:
+            out_of_range = pc.or_(out_of_range, pc.greater(values, high))
+        bad = pc.sum(out_of_range).as_py() or 0
+        if bad:
+            bounds = pc.min_max(values).as_py()
+            errors.append(
+                f"{column}: {bad} value(s) outside [{low}, {high}] "
+                f"(min {bounds['min']}, max {bounds['max']})"
+            )
+
+    # Empty nested arrays/objects
+    for column, max_rate in empty_rates.items():
+        values = table[column]
+        if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+            values = pc.cast(values, pa.large_string())
+        empty = pc.or_kleene(
+            pc.is_null(values),
+            pc.is_in(pc.utf8_trim_whitespace(values), value_set=EMPTY_JSON_VALUES.cast(values.type))
+        )
+        empty_count = pc.sum(empty).as_py() or 0
+        if rows and empty_count / rows > max_rate:
+            errors.append(f"{column}: {empty_count}/{rows} empty (max rate {max_rate:.0%})")
+
+    # Row-count drift for streams that should be stable between runs
+    if checks.max_row_delta is not None and previous_rows:
+        delta = abs(rows - previous_rows) / previous_rows
+        if delta > checks.max_row_delta:
+            errors.append(
+                f"row count {rows} vs {previous_rows} in previous run "
+                f"({delta:.0%} change, max {checks.max_row_delta:.0%})"
+            )
+
+    return rows, errors
+
+
+def validate_directory(input_dir: str, state_file: Optional[str] = None,
+                       quarantine: bool = True) -> Dict[str, List[str]]:
+    """
+    Validate every parquet file in a directory.
+
+    Args:
+        input_dir: Directory containing Parquet files
+        state_file: JSON file with the previous run's row counts
+            (default: <input_dir>/_validation_state.json)
+        quarantine: Move failing files to <input_dir>/rejected/
+
+    Returns:
+        dict mapping rejected file name -> failure messages
+    """
+    state_path = state_file or os.path.join(input_dir, STATE_FILE)
+    state = {}
+    if os.path.exists(state_path):
+        with open(state_path) as f:
+            state = json.load(f)
+
+    rejected = {}
+    for parquet_file in sorted(Path(input_dir).glob("*.parquet")):
+        stream_name = parquet_file.stem
+        checks = checks_for(stream_name)
+        if checks is None:
+            logger.info(f"- {parquet_file.name}: no checks defined")
+            continue
+
+        started = time.perf_counter()
+        rows, errors = validate_file(parquet_file, checks, state.get(stream_name))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if errors:
+            rejected[parquet_file.name] = errors
+            logger.error(f"✗ {parquet_file.name}: {rows} rows, {len(errors)} failed check(s) in {elapsed_ms:.0f}ms")
+            for error in errors:
+                logger.error(f"    {error}")
+            if quarantine:
+                rejected_dir = os.path.join(input_dir, REJECTED_DIR)
+                os.makedirs(rejected_dir, exist_ok=True)
+                shutil.move(str(parquet_file), os.path.join(rejected_dir, parquet_file.name))
+        else:
+            # Only accepted files become the baseline for the next run
+            state[stream_name] = rows
+            logger.info(f"✓ {parquet_file.name}: {rows} rows passed in {elapsed_ms:.0f}ms")
+
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+    return rejected
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Validate Parquet files before loading them to Snowflake'
+    )
+    parser.add_argument(
+        '--input-dir',
+        type=str,
+        default='./data',
+        help='Directory containing Parquet files (default: ./data)'
+    )
+    parser.add_argument(
+        '--state-file',
+        type=str,
+        default=None,
+        help=f'Row counts from the previous run (default: <input-dir>/{STATE_FILE})'
+    )
+    parser.add_argument(
+        '--no-quarantine',
+        action='store_true',
+        help=f'Report failures without moving files to <input-dir>/{REJECTED_DIR}/'
+    )
+
+    args = parser.parse_args()
+
+    rejected = validate_directory(
+        args.input_dir,
+        state_file=args.state_file,
+        quarantine=not args.no_quarantine,
+    )
+    if rejected:
+        logger.error(f"{len(rejected)} file(s) rejected: {', '.join(rejected)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()